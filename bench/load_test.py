@@ -0,0 +1,428 @@
+"""Offline load generator: real websocket sessions against a running server.
+
+Starts the app separately (``streamlit run portfoliomainfile.py`` or
+``scripts/run_replicas.py``), then opens many browser-like sessions on
+``/_stcore/stream``. Each virtual visitor repeatedly picks a weighted
+navigation script (browse, quiz, contact, full journey), replays it one
+rerun at a time with Streamlit's own BackMsg/ForwardMsg protobufs and
+closes the session. The session count ramps through ``--ramp``; each step
+reports throughput, p50/p95/p99 rerun latency, error rate and the server's
+CPU and RSS (total and per open session), read from /proc.
+
+    python bench/load_test.py --url http://127.0.0.1:8501 --ramp 1,10,25,50,100
+    python bench/load_test.py --think 0 --step-duration 60 --json load.json
+    python bench/load_test.py --source-ips 64      # spread over replicas
+    python bench/load_test.py --url "http://127.0.0.1:8501/?lite=1"
+
+Only needs what Streamlit already installs (tornado, protobuf) and Linux.
+Run the server with a throwaway ``PORTFOLIO_DATA_DIR``: the contact script
+really queues messages.
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import random
+import statistics
+import sys
+import time
+from urllib.parse import urlsplit
+
+MENU = "🔍 Explore Sections:"
+CHART = "📈 Choose visualization type:"
+PROJECT = "🔍 Select a project to explore:"
+
+# Pause after a failed session, so a down server is not hammered in a loop
+FAILURE_PAUSE = 0.5
+
+
+def _streamlit_version():
+    try:
+        from importlib.metadata import version
+
+        return tuple(int(part) for part in version("streamlit").split(".")[:2])
+    except Exception:
+        return (0, 0)
+
+
+# Streamlit 1.45 started sending selectbox values as the option text
+STRING_SELECTBOX = _streamlit_version() >= (1, 45)
+
+# Server processes to sample when no --pid is given (cmdline substrings)
+SERVER_MATCH = ("portfoliomainfile.py", "scripts/replica.py")
+
+
+def _select(label, value):
+    return ("select", label, value)
+
+
+def _click(label):
+    return ("click", label)
+
+
+def _fill(label, text):
+    return ("fill", label, text)
+
+
+def _contact(n):
+    return [
+        _select(MENU, "📞 Contact"),
+        _fill("👤 Your Name *", "Load Test"),
+        _fill("📧 Your Email *", f"load{n}@example.com"),
+        # Unique text, or the outbox rejects it as a duplicate
+        _fill("💬 Your Message *", f"Load test message {n} {time.time()}"),
+        _click("🚀 Send Message"),
+    ]
+
+
+_QUIZ = [
+    _select(MENU, "🎯 Interactive Quiz"),
+    _select("Choose your answer for Q1:", 0),
+    _click("Submit Answer 1"),
+    _click("🎉 Finish Quiz"),
+]
+_CHARTS = [
+    _select(MENU, "📊 Skills Chart"),
+    _select(CHART, "Radar Chart"),
+    _select(CHART, "Scatter Plot"),
+    _select(CHART, "Bar Chart"),
+]
+_PROJECTS = [
+    _select(MENU, "💼 Projects"),
+    _select(PROJECT, 1),
+    _select(PROJECT, 2),
+]
+
+# name -> (weight, steps factory); the initial Home render is implicit
+SCRIPTS = {
+    "browse": (5, lambda n: [*_PROJECTS, *_CHARTS, _select(MENU, "🏠 Home")]),
+    "quiz": (3, lambda n: list(_QUIZ)),
+    "contact": (1, _contact),
+    "journey": (2, lambda n: [*_PROJECTS, *_CHARTS, *_QUIZ, *_contact(n)]),
+}
+
+
+class StepError(Exception):
+    pass
+
+
+class BrowserSession:
+    """One websocket session speaking the browser's side of the protocol."""
+
+    def __init__(self, url, source_ip=None, timeout=30.0):
+        self.url = url
+        self.source_ip = source_ip
+        self.timeout = timeout
+        self.ws = None
+        self.query_string = urlsplit(url).query  # e.g. lite=1
+        self.page_script_hash = ""  # from the server's first new_session
+        self.widgets = {}  # label -> (kind, proto, fragment id) from the latest run
+        self.values = {}  # widget id -> WidgetState kept across reruns
+        self.cache = {}  # message hash -> ForwardMsg, for ref_hash replies
+
+    async def connect(self):
+        from tornado.httpclient import HTTPRequest
+        from tornado.websocket import websocket_connect
+
+        parts = urlsplit(self.url)
+        ws_url = f"{parts.scheme.replace('http', 'ws', 1)}://{parts.netloc}{parts.path.rstrip('/')}/_stcore/stream"
+        headers = {}
+        if self.source_ip:
+            # Own IP per visitor: the proxy routes by the socket address; a
+            # single server run with PORTFOLIO_TRUSTED_PROXIES=1 counts the
+            # contact limit per X-Forwarded-For address
+            headers["X-Forwarded-For"] = self.source_ip
+        request = HTTPRequest(ws_url, headers=headers, network_interface=self.source_ip,
+                              connect_timeout=self.timeout, request_timeout=self.timeout)
+        self.ws = await websocket_connect(request, subprotocols=["streamlit"], max_message_size=64 * 1024 * 1024)
+        await self.rerun()
+
+    def close(self):
+        if self.ws is not None:
+            self.ws.close()
+
+    async def rerun(self, trigger=None, fragment_id=""):
+        """Send a rerun with the current widget states; wait for it to finish.
+
+        With ``fragment_id`` only that fragment reruns, as when the browser
+        reports a change to a widget inside an ``st.fragment``.
+        """
+        from streamlit.proto.BackMsg_pb2 import BackMsg
+        from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+        msg = BackMsg()
+        # The first rerun sets no other field; without this the oneof stays
+        # unset and the message serializes to zero bytes
+        msg.rerun_script.SetInParent()
+        msg.rerun_script.query_string = self.query_string
+        msg.rerun_script.page_script_hash = self.page_script_hash
+        msg.rerun_script.fragment_id = fragment_id
+        states = msg.rerun_script.widget_states.widgets
+        for state in self.values.values():
+            states.add().CopyFrom(state)
+        if trigger is not None:
+            state = states.add()
+            state.id = trigger
+            state.trigger_value = True
+        await self.ws.write_message(msg.SerializeToString(), binary=True)
+
+        if fragment_id:
+            # Widgets outside the fragment are not sent again
+            self.widgets = {label: w for label, w in self.widgets.items() if w[2] != fragment_id}
+        else:
+            self.widgets = {}
+        errors = 0
+        deadline = time.monotonic() + self.timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise StepError("timeout")
+            data = await asyncio.wait_for(self.ws.read_message(), remaining)
+            if data is None:
+                raise StepError("disconnected")
+            forward = ForwardMsg.FromString(data)
+            kind = forward.WhichOneof("type")
+            if kind == "ref_hash":
+                forward = self.cache.get(forward.ref_hash, forward)
+                kind = forward.WhichOneof("type")
+            elif forward.metadata.cacheable:
+                self.cache[forward.hash] = forward
+            if kind == "new_session":
+                self.page_script_hash = forward.new_session.page_script_hash
+            elif kind == "delta" and forward.delta.WhichOneof("type") == "new_element":
+                errors += self._collect(forward.delta.new_element, forward.delta.fragment_id)
+            elif kind == "script_finished":
+                if forward.script_finished == ForwardMsg.FINISHED_EARLY_FOR_RERUN:
+                    # st.rerun(): the follow-up run is part of this step
+                    self.widgets = {}
+                    continue
+                if forward.script_finished == ForwardMsg.FINISHED_WITH_COMPILE_ERROR:
+                    raise StepError("compile error")
+                return errors
+
+    def _collect(self, element, fragment_id):
+        kind = element.WhichOneof("type")
+        if kind == "exception":
+            return 1
+        if kind is None:
+            return 0
+        widget = getattr(element, kind)
+        if hasattr(widget, "id") and hasattr(widget, "label"):
+            self.widgets[widget.label] = (kind, widget, fragment_id)
+        return 0
+
+    def _widget(self, label):
+        try:
+            return self.widgets[label]
+        except KeyError:
+            raise StepError(f"no widget {label!r}") from None
+
+    async def step(self, step):
+        """Apply one scripted step; return (timed, app errors)."""
+        from streamlit.proto.WidgetStates_pb2 import WidgetState
+
+        action, label = step[0], step[1]
+        kind, widget, fragment_id = self._widget(label)
+        if action == "click":
+            return True, await self.rerun(trigger=widget.id, fragment_id=fragment_id)
+        state = WidgetState(id=widget.id)
+        if action == "fill":
+            state.string_value = step[2]
+            self.values[widget.id] = state
+            return False, 0
+        value = step[2]
+        options = list(widget.options)
+        if isinstance(value, str):
+            if value not in options:
+                raise StepError(f"{label!r} has no option {value!r}")
+            value = options.index(value)
+        if kind == "selectbox" and STRING_SELECTBOX:
+            state.string_value = options[value]
+        else:
+            state.int_value = value
+        self.values[widget.id] = state
+        return True, await self.rerun(fragment_id=fragment_id)
+
+
+class Stats:
+    def __init__(self):
+        self.latencies = []
+        self.reruns = 0
+        self.errors = 0
+        self.app_errors = 0
+        self.failures = {}
+        self.open_sessions = 0
+        self.peak_sessions = 0
+
+    def fail(self, reason):
+        self.errors += 1
+        self.failures[reason] = self.failures.get(reason, 0) + 1
+
+
+async def visitor(args, stats, source_ips, counter, stop):
+    rng = random.Random()
+    names = list(SCRIPTS)
+    weights = [SCRIPTS[name][0] for name in names]
+    while not stop.is_set():
+        name = rng.choices(names, weights)[0]
+        steps = SCRIPTS[name][1](next(counter))
+        session = BrowserSession(args.url, next(source_ips), args.timeout)
+        try:
+            start = time.perf_counter()
+            await session.connect()
+            stats.latencies.append(time.perf_counter() - start)
+            stats.reruns += 1
+            stats.open_sessions += 1
+            stats.peak_sessions = max(stats.peak_sessions, stats.open_sessions)
+            try:
+                for step in steps:
+                    if stop.is_set():
+                        break
+                    if args.think:
+                        await asyncio.sleep(rng.expovariate(1 / args.think))
+                    start = time.perf_counter()
+                    timed, app_errors = await session.step(step)
+                    if timed:
+                        stats.latencies.append(time.perf_counter() - start)
+                        stats.reruns += 1
+                        stats.app_errors += app_errors
+            finally:
+                stats.open_sessions -= 1
+        except StepError as exc:
+            stats.fail(str(exc).split(" '")[0])
+            await asyncio.sleep(FAILURE_PAUSE)
+        except Exception as exc:  # connection, timeout and websocket errors
+            stats.fail(type(exc).__name__)
+            await asyncio.sleep(FAILURE_PAUSE)
+        finally:
+            session.close()
+
+
+def find_server_pids():
+    pids = []
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit() or int(entry) == os.getpid():
+            continue
+        try:
+            with open(f"/proc/{entry}/cmdline", "rb") as f:
+                cmdline = f.read().replace(b"\0", b" ").decode("utf-8", "replace")
+        except OSError:
+            continue
+        if any(match in cmdline for match in SERVER_MATCH) and "load_test.py" not in cmdline:
+            pids.append(int(entry))
+    return pids
+
+
+def sample_process(pids):
+    """Return (total RSS bytes, total CPU seconds) of ``pids``."""
+    page_size = os.sysconf("SC_PAGE_SIZE")
+    ticks = os.sysconf("SC_CLK_TCK")
+    rss = cpu = 0
+    for pid in pids:
+        try:
+            with open(f"/proc/{pid}/statm") as f:
+                rss += int(f.read().split()[1]) * page_size
+            with open(f"/proc/{pid}/stat") as f:
+                fields = f.read().rsplit(")", 1)[1].split()
+            cpu += (int(fields[11]) + int(fields[12])) / ticks  # utime + stime
+        except (OSError, IndexError, ValueError):
+            pass
+    return rss, cpu
+
+
+def percentile(values, q):
+    return values[min(len(values) - 1, int(q * len(values)))] * 1000 if values else 0.0
+
+
+async def run_step(args, sessions, pids, idle_rss, source_ips, counter):
+    stats = Stats()
+    stop = asyncio.Event()
+    _, cpu_before = sample_process(pids)
+    started = time.perf_counter()
+    tasks = [asyncio.create_task(visitor(args, stats, source_ips, counter, stop)) for _ in range(sessions)]
+    await asyncio.sleep(args.step_duration * 0.8)
+    # RSS while every visitor has a session open
+    rss, _ = sample_process(pids)
+    open_sessions = stats.open_sessions
+    await asyncio.sleep(args.step_duration * 0.2)
+    stop.set()
+    wall = time.perf_counter() - started
+    _, cpu_after = sample_process(pids)
+    await asyncio.gather(*tasks)
+
+    latencies = sorted(stats.latencies)
+    attempts = stats.reruns + stats.errors
+    return {
+        "sessions": sessions,
+        "reruns": stats.reruns,
+        "throughput_rps": stats.reruns / wall,
+        "p50_ms": statistics.median(latencies) * 1000 if latencies else 0.0,
+        "p95_ms": percentile(latencies, 0.95),
+        "p99_ms": percentile(latencies, 0.99),
+        "error_rate": stats.errors / attempts if attempts else 0.0,
+        "app_exceptions": stats.app_errors,
+        "failures": stats.failures,
+        "server_cpu_pct": (cpu_after - cpu_before) / wall * 100,
+        "server_rss_mib": rss / 2**20,
+        "rss_kib_per_session": (rss - idle_rss) / 1024 / open_sessions if open_sessions else 0.0,
+    }
+
+
+async def main_async(args):
+    # Fail early rather than counting every session as an error
+    import streamlit.proto.BackMsg_pb2  # noqa: F401
+    import tornado.websocket  # noqa: F401
+
+    pids = args.pid or find_server_pids()
+    if not pids:
+        print("warning: no server process found; CPU/RSS columns will be 0 (use --pid)", file=sys.stderr)
+    idle_rss, _ = sample_process(pids)
+    if args.source_ips:
+        source_ips = itertools.cycle(f"127.0.{i // 254}.{i % 254 + 1}" for i in range(1, args.source_ips + 1))
+    else:
+        source_ips = itertools.repeat(None)
+    counter = itertools.count()
+
+    print(f"server pids: {pids or '-'}  idle RSS: {idle_rss / 2**20:.0f} MiB")
+    print(f"{'sessions':>8}{'rps':>9}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}"
+          f"{'errors':>8}{'cpu %':>8}{'RSS MiB':>9}{'KiB/sess':>10}")
+    results = []
+    for sessions in args.ramp:
+        result = await run_step(args, sessions, pids, idle_rss, source_ips, counter)
+        results.append(result)
+        print(f"{sessions:>8}{result['throughput_rps']:>9.1f}{result['p50_ms']:>9.1f}{result['p95_ms']:>9.1f}"
+              f"{result['p99_ms']:>9.1f}{result['error_rate']:>8.1%}{result['server_cpu_pct']:>8.0f}"
+              f"{result['server_rss_mib']:>9.0f}{result['rss_kib_per_session']:>10.0f}")
+        if result["failures"]:
+            print(f"{'':>8}failures: {result['failures']}")
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", default="http://127.0.0.1:8501", help="app (or replica proxy) URL; its query string is sent with every rerun")
+    parser.add_argument("--ramp", default="1,5,10,25,50",
+                        type=lambda text: [int(n) for n in text.split(",")],
+                        help="concurrent visitors per step, comma separated")
+    parser.add_argument("--step-duration", type=float, default=30.0, help="seconds per ramp step")
+    parser.add_argument("--think", type=float, default=1.0,
+                        help="mean think time between steps in seconds (0 = saturate)")
+    parser.add_argument("--timeout", type=float, default=30.0, help="per-rerun timeout")
+    parser.add_argument("--pid", type=int, action="append", help="server process to sample (repeatable)")
+    parser.add_argument("--source-ips", type=int, default=0,
+                        help="spread visitors over N loopback source addresses (127.0.x.y)")
+    parser.add_argument("--json", default=None, help="also write the results to this file")
+    args = parser.parse_args(argv)
+
+    results = asyncio.run(main_async(args))
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"url": args.url, "think": args.think, "steps": results}, f, indent=2)
+            f.write("\n")
+    return 1 if any(r["error_rate"] > 0.05 for r in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
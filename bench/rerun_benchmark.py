@@ -0,0 +1,322 @@
+"""Headless rerun benchmark for every section of the portfolio app.
+
+Drives ``portfoliomainfile.py`` with Streamlit's ``AppTest``: selects each
+section, chart type and skill category and clicks the interactive
+buttons, recording p50/p95 rerun latency, peak traced memory and the delta
+bytes sent per rerun. Results are compared with ``bench/baseline.json``
+and the run fails when a scenario regresses past ``--threshold``.
+
+    python bench/rerun_benchmark.py                   # compare with baseline
+    python bench/rerun_benchmark.py --update-baseline
+    python bench/rerun_benchmark.py --sessions 8 --duration 30
+    python bench/rerun_benchmark.py --compare-modes   # full vs lite mode
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP = os.path.join(ROOT, "portfoliomainfile.py")
+BASELINE = os.path.join(ROOT, "bench", "baseline.json")
+
+# Keep benchmark counters and outbox rows out of the real database
+os.environ.setdefault("PORTFOLIO_DATA_DIR", tempfile.mkdtemp(prefix="portfolio-bench-"))
+sys.path.insert(0, ROOT)
+
+MENU = "🔍 Explore Sections:"
+CHART = "📈 Choose visualization type:"
+SKILL = "🎯 Choose a skill category to explore:"
+WARMUP_TIMEOUT = 180  # seconds to wait for the app's warm-up before timing
+# Metrics checked against the baseline, with the smallest change that
+# counts as a regression whatever the ratio. Latency is gated on p50: with
+# --repeats 20 the p95 is the second-slowest rerun, which any background
+# flush or GC pause can double.
+NOISE_FLOOR = {"p50_ms": 5.0, "peak_kib": 64.0, "payload_bytes": 0.0}
+
+
+def _select(label, value):
+    return ("select", label, value)
+
+
+def _click(key=None, label=None):
+    return ("click", key, label)
+
+
+def scenarios():
+    """Return ``[(name, setup_steps, action_steps), ...]``."""
+    from portfolio.charts import CHART_TYPES
+    from portfolio import content
+    from sections import SECTIONS
+
+    result = [(f"nav:{section}", [], [_select(MENU, section)]) for section in SECTIONS]
+    for chart_type in CHART_TYPES:
+        result.append((f"chart:{chart_type}", [_select(MENU, "📊 Skills Chart")], [_select(CHART, chart_type)]))
+    for category in content.skill_categories():
+        result.append((f"skills:{category.id}", [_select(MENU, "🔬 Skills")], [_select(SKILL, category)]))
+    result += [
+        ("click:linkedin", [], [_click("linkedin_btn")]),
+        ("click:skill", [_select(MENU, "🔬 Skills")], [_click("bio_0")]),
+        ("click:verify", [_select(MENU, "🏅 Certifications")], [_click("cert_0")]),
+        ("click:quiz-answer", [_select(MENU, "🎯 Interactive Quiz")], [_click("submit_0")]),
+        ("click:celebrate", [], [_click(label="🎊 Celebrate Biotech Innovation!")]),
+    ]
+    return result
+
+
+def _apply(at, step):
+    kind = step[0]
+    if kind == "select":
+        _, label, value = step
+        widget = next((w for w in at.selectbox if w.label == label), None)
+        if widget is None:
+            raise LookupError(f"no selectbox labelled {label!r}")
+        widget.select(value)
+    else:
+        _, key, label = step
+        if key is not None:
+            at.button(key=key).click()
+        else:
+            next(b for b in at.button if b.label == label).click()
+
+
+def _run(at):
+    at.run()
+    if at.exception:
+        raise RuntimeError(at.exception[0].message)
+
+
+def _payload_total():
+    from portfolio import metrics
+
+    # AppTest always runs the whole script, so fragments are tracked inside
+    # their section too; only top-level names add up to what was sent
+    return sum(metrics.stats(row["name"]).payload_bytes.total for row in metrics.summary()
+               if not row["name"].startswith("fragment:"))
+
+
+def new_session(timeout, lite=False):
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(APP, default_timeout=timeout)
+    if lite:
+        at.query_params["lite"] = "1"
+    _run(at)
+    return at
+
+
+def wait_for_warmup(timeout):
+    """Start the app's warm-up thread and wait for it, so it does not skew timings."""
+    from portfolio.lazy import warmup_status
+
+    new_session(timeout)
+    deadline = time.monotonic() + WARMUP_TIMEOUT
+    while not warmup_status()[0] and time.monotonic() < deadline:
+        time.sleep(0.1)
+
+
+def run_scenario(name, setup, action, repeats, timeout, lite=False):
+    at = new_session(timeout, lite)
+    for step in setup:
+        _apply(at, step)
+        _run(at)
+
+    # Latency pass; the first rerun warms caches and is not counted
+    timings = []
+    payload_before = None
+    for i in range(repeats + 1):
+        for step in action:
+            _apply(at, step)
+        if i == 1:
+            payload_before = _payload_total()
+        start = time.perf_counter()
+        _run(at)
+        if i:
+            timings.append(time.perf_counter() - start)
+    payload = (_payload_total() - payload_before) / repeats if repeats else 0.0
+
+    # Memory pass, separate because tracing slows everything down
+    tracemalloc.start()
+    for step in action:
+        _apply(at, step)
+    baseline_bytes = tracemalloc.get_traced_memory()[0]
+    _run(at)
+    peak = tracemalloc.get_traced_memory()[1] - baseline_bytes
+    tracemalloc.stop()
+
+    timings.sort()
+    return {
+        "p50_ms": statistics.median(timings) * 1000,
+        "p95_ms": timings[min(len(timings) - 1, int(0.95 * len(timings)))] * 1000,
+        "peak_kib": peak / 1024,
+        "payload_bytes": payload,
+    }
+
+
+def run_concurrent(sessions, duration, timeout):
+    """Drive ``sessions`` AppTest sessions from parallel threads for ``duration`` seconds."""
+    all_scenarios = scenarios()
+    timings = []
+    errors = []
+    lock = threading.Lock()
+    deadline = time.perf_counter() + duration
+
+    def worker(offset):
+        try:
+            at = new_session(timeout)
+        except Exception as exc:
+            with lock:
+                errors.append(repr(exc))
+            return
+        index = offset
+        while time.perf_counter() < deadline:
+            _, setup, action = all_scenarios[index % len(all_scenarios)]
+            index += 1
+            try:
+                for step in setup:
+                    _apply(at, step)
+                    _run(at)
+                for step in action:
+                    _apply(at, step)
+                start = time.perf_counter()
+                _run(at)
+                elapsed = time.perf_counter() - start
+            except Exception as exc:
+                with lock:
+                    errors.append(repr(exc))
+                continue
+            with lock:
+                timings.append(elapsed)
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(sessions)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    wall = time.perf_counter() - started
+
+    timings.sort()
+    return {
+        "sessions": sessions,
+        "reruns": len(timings),
+        "throughput_rps": len(timings) / wall if wall else 0.0,
+        "p50_ms": statistics.median(timings) * 1000 if timings else 0.0,
+        "p95_ms": timings[int(0.95 * (len(timings) - 1))] * 1000 if timings else 0.0,
+        "errors": len(errors),
+    }
+
+
+def compare_modes(repeats, timeout, only=None):
+    """Run every scenario in full and lite mode and print them side by side."""
+    from portfolio.static_assets import get_stylesheet
+
+    print(f"{'scenario':<40}{'p50 ms':>9}{'lite':>9}{'bytes':>9}{'lite':>9}{'saved':>8}")
+    totals = [0.0, 0.0, 0.0, 0.0]
+    for name, setup, action in scenarios():
+        if only and only not in name:
+            continue
+        full = run_scenario(name, setup, action, repeats, timeout)
+        lite = run_scenario(name, setup, action, repeats, timeout, lite=True)
+        row = [full["p50_ms"], lite["p50_ms"], full["payload_bytes"], lite["payload_bytes"]]
+        totals = [t + v for t, v in zip(totals, row)]
+        saved = 1 - row[3] / row[2] if row[2] else 0.0
+        print(f"{name:<40}{row[0]:>9.1f}{row[1]:>9.1f}{row[2]:>9.0f}{row[3]:>9.0f}{saved:>8.0%}")
+    saved = 1 - totals[3] / totals[2] if totals[2] else 0.0
+    print(f"{'total':<40}{totals[0]:>9.1f}{totals[1]:>9.1f}{totals[2]:>9.0f}{totals[3]:>9.0f}{saved:>8.0%}")
+
+    # The stylesheet is inlined in every rerun and counted in the bytes above
+    for sheet_name in ("theme", "lite"):
+        print(f"stylesheet {sheet_name}: {len(get_stylesheet(sheet_name).css.encode('utf-8')):,} bytes")
+
+
+def compare(results, baseline, threshold):
+    """Return human-readable regressions of ``results`` against ``baseline``."""
+    regressions = []
+    for name, result in results.items():
+        previous = baseline.get(name)
+        if not previous:
+            continue
+        for metric, noise in NOISE_FLOOR.items():
+            old, new = previous.get(metric), result[metric]
+            if old and new > old * (1 + threshold) and new - old > noise:
+                regressions.append(f"{name} {metric}: {old:.1f} -> {new:.1f} (+{new / old - 1:.0%})")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeats", type=int, default=20, help="timed reruns per scenario")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="allowed relative regression before failing (default 0.25)")
+    parser.add_argument("--baseline", default=BASELINE)
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--only", default=None, help="run scenarios whose name contains this")
+    parser.add_argument("--sessions", type=int, default=0, help="run the concurrent mode with N sessions")
+    parser.add_argument("--duration", type=float, default=20.0, help="seconds for the concurrent mode")
+    parser.add_argument("--timeout", type=float, default=30.0, help="AppTest rerun timeout")
+    parser.add_argument("--compare-modes", action="store_true",
+                        help="compare full and lite mode instead of checking the baseline")
+    args = parser.parse_args(argv)
+
+    if not (args.update_baseline or args.compare_modes or args.sessions or os.path.exists(args.baseline)):
+        print(f"No baseline at {args.baseline}; run with --update-baseline first")
+        return 1
+
+    wait_for_warmup(args.timeout)
+    if args.compare_modes:
+        compare_modes(args.repeats, args.timeout, args.only)
+        return 0
+
+    if args.sessions:
+        report = run_concurrent(args.sessions, args.duration, args.timeout)
+        print(json.dumps(report, indent=2))
+        return 1 if report["errors"] else 0
+
+    results = {}
+    print(f"{'scenario':<40}{'p50 ms':>9}{'p95 ms':>9}{'peak KiB':>10}{'bytes':>9}")
+    for name, setup, action in scenarios():
+        if args.only and args.only not in name:
+            continue
+        result = results[name] = run_scenario(name, setup, action, args.repeats, args.timeout)
+        print(f"{name:<40}{result['p50_ms']:>9.1f}{result['p95_ms']:>9.1f}"
+              f"{result['peak_kib']:>10.0f}{result['payload_bytes']:>9.0f}")
+
+    if args.update_baseline:
+        baseline = {}
+        if os.path.exists(args.baseline):
+            with open(args.baseline, encoding="utf-8") as f:
+                baseline = json.load(f)
+        baseline.update({name: {k: round(v, 2) for k, v in r.items()} for name, r in results.items()})
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(baseline, f, indent=2, ensure_ascii=False, sort_keys=True)
+            f.write("\n")
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline = json.load(f)
+    regressions = []
+    for name, setup, action in scenarios():
+        if name not in results:
+            continue
+        found = compare({name: results[name]}, baseline, args.threshold)
+        if found:
+            # Confirm with a second run, so a one-off stall of the machine
+            # does not fail the gate
+            retry = run_scenario(name, setup, action, args.repeats, args.timeout)
+            found = compare({name: retry}, baseline, args.threshold)
+        regressions += found
+    for regression in regressions:
+        print(f"REGRESSION: {regression}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
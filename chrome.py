@@ -0,0 +1,99 @@
+"""Shared page chrome: theme styles, sidebar and footer.
+
+Everything static here is built once when the module is first imported
+and reused by every session; the render functions only emit elements.
+"""
+
+import streamlit as st
+
+from portfolio import content, lite
+from portfolio.counters import QUIZ_COMPLETIONS, SESSIONS, counters
+from portfolio.search import MAX_QUERY_LENGTH, search_index
+from portfolio.session import MAX_NAME_LENGTH
+from portfolio.static_assets import get_stylesheet
+from portfolio.templates import footer_html
+from sections import SECTIONS
+
+MENU_OPTIONS = list(SECTIONS)
+
+
+def render_styles():
+    # Custom CSS for biotechnology-themed styling and animations, minified
+    # once per process. It is inlined because app/static serves .css as
+    # text/plain. Lite mode gets a flat sheet without keyframes or web fonts.
+    sheet = get_stylesheet("lite" if lite.enabled() else "theme")
+    st.markdown(sheet.style_tag(), unsafe_allow_html=True)
+
+
+def _set_lite():
+    st.session_state.visitor.lite = st.session_state.lite_mode
+
+
+def render_sidebar():
+    """Draw the sidebar and return the selected menu option."""
+    with st.sidebar:
+        st.markdown("## 🧬 Navigation")
+
+        # Visitor greeting
+        visitor = st.session_state.visitor
+        visitor_name = st.text_input("👋 What's your name?", value=visitor.visitor_name,
+                                     max_chars=MAX_NAME_LENGTH)
+        if visitor_name:
+            visitor.visitor_name = visitor_name
+            st.success(f"Welcome, {visitor.visitor_name}! 🎉")
+
+        # The callback runs before the script, so the styles emitted above
+        # this toggle already match the new mode
+        st.toggle("🪶 Lite mode", value=visitor.lite, key="lite_mode", on_change=_set_lite,
+                  help="Flat styles, no animations or balloons and static charts for slow connections")
+
+        # Search across skills, certifications, projects and documents
+        query = st.text_input("🔎 Search the portfolio", placeholder="e.g. CRISPR, qPCR, poster",
+                              max_chars=MAX_QUERY_LENGTH)
+        if query:
+            results = search_index().search(query, limit=5)
+            if not results:
+                st.caption("No matches found.")
+            for result in results:
+                st.markdown(f"**{result['title']}**  \n{result['section']}")
+
+        st.markdown("---")
+
+        # Interactive menu; ?section=<page module> (e.g. ?section=quiz)
+        # preselects a page, which is how the static export links back here
+        modules = list(SECTIONS.values())
+        wanted = st.query_params.get("section")
+        index = modules.index(wanted) if wanted in modules else 0
+        menu_option = st.selectbox("🔍 Explore Sections:", MENU_OPTIONS, index=index)
+
+        st.markdown("---")
+
+        # Quick stats
+        st.markdown("### 📊 Biotech Stats")
+        for row in content.sidebar_stats():
+            for col, (label, value, delta) in zip(st.columns(len(row)), row):
+                with col:
+                    st.metric(label, value, delta)
+
+        # Live visitor stats, read from the in-memory counter snapshot
+        st.markdown("### 👀 Visitor Stats")
+        stats = counters.snapshot()
+        col1, col2 = st.columns(2)
+        with col1:
+            st.metric("Visitors", f"{stats.get(SESSIONS, 0):,}")
+        with col2:
+            st.metric("Quizzes Taken", f"{stats.get(QUIZ_COMPLETIONS, 0):,}")
+
+    return menu_option
+
+
+def render_footer():
+    # Footer with the shared visitor counter
+    st.markdown("---")
+    visitor = st.session_state.visitor
+    st.markdown(footer_html(counters.value(SESSIONS), visitor.visitor_name_html), unsafe_allow_html=True)
+
+    # Add some interactive elements at the bottom
+    if st.button("🎊 Celebrate Biotech Innovation!"):
+        lite.celebrate()
+        st.success("🎉 Thank you for exploring my biotech portfolio!")
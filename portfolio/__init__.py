@@ -0,0 +1 @@
+"""Backend helpers for the portfolio app (no Streamlit pages in here)."""
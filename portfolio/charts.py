@@ -0,0 +1,243 @@
+"""Process-wide cache of compact plotly figure payloads.
+
+Building a figure with plotly express is the most expensive thing the
+Skills Chart page does, and every visitor asks for the same few figures.
+Figures are built once per (chart type, data hash), serialized to JSON
+with the bulky default template removed and floats rounded, and the JSON
+is handed to ``st.plotly_chart`` on every later request.
+"""
+
+import hashlib
+import json
+import os
+import threading
+
+from portfolio.documents import ROOT
+from portfolio.lazy import lazy_import
+
+px = lazy_import("plotly.express")
+go = lazy_import("plotly.graph_objects")
+pd = lazy_import("pandas")
+pio = lazy_import("plotly.io")
+
+CHART_TYPES = ["Bar Chart", "Radar Chart", "Scatter Plot"]
+
+# PNG renders for lite mode, kept across restarts (kaleido is slow to start)
+IMAGE_DIR = os.path.join(ROOT, ".cache", "charts")
+IMAGE_SIZE = (700, 450)
+
+SKILLS_DATA = {
+    'Skill Category': ['CRISPR-Cas9', 'qPCR', 'Bioinformatics',
+                       'Bioprocessing', 'Molecular Diagnostics', 'Scientific Communication'],
+    'Proficiency Level': [9, 8, 7, 8, 9, 9],
+    'Experience (Months)': [18, 24, 12, 15, 20, 36]
+}
+
+# Digits kept for floats in the payload; more is invisible on screen
+FLOAT_DIGITS = 3
+
+
+def data_hash(data):
+    """Stable hash of JSON-serializable chart source data."""
+    encoded = json.dumps(data, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()[:16]
+
+
+def build_figure(chart_type, data):
+    df = pd.DataFrame(data)
+
+    if chart_type == "Bar Chart":
+        return px.bar(df, x='Skill Category', y='Proficiency Level',
+                      title="🎯 Biotech Skill Proficiency",
+                      color='Proficiency Level',
+                      color_continuous_scale='Greens')
+
+    if chart_type == "Radar Chart":
+        fig = go.Figure()
+        fig.add_trace(go.Scatterpolar(
+            r=df['Proficiency Level'],
+            theta=df['Skill Category'],
+            fill='toself',
+            name='Proficiency'
+        ))
+        fig.update_layout(
+            polar=dict(
+                radialaxis=dict(
+                    visible=True,
+                    range=[0, 10]
+                )),
+            showlegend=False,
+            title="🕸 Biotech Skills Radar"
+        )
+        return fig
+
+    if chart_type == "Scatter Plot":
+        return px.scatter(df, x='Experience (Months)', y='Proficiency Level',
+                          size='Proficiency Level', hover_name='Skill Category',
+                          title="📈 Experience vs Proficiency in Biotech")
+
+    raise ValueError(f"Unknown chart type: {chart_type!r}")
+
+
+def _round_floats(value):
+    if isinstance(value, float):
+        return round(value, FLOAT_DIGITS)
+    if isinstance(value, list):
+        return [_round_floats(v) for v in value]
+    if isinstance(value, dict):
+        return {k: _round_floats(v) for k, v in value.items()}
+    return value
+
+
+def compact_figure_json(fig):
+    """Serialize ``fig`` without its template and with rounded floats."""
+    payload = json.loads(pio.to_json(fig, validate=False))
+    # An empty template (rather than none at all) stops plotly from
+    # re-attaching its ~10 KB default when Streamlit rebuilds the figure;
+    # Streamlit's own chart theme styles it in the browser.
+    payload.setdefault("layout", {})["template"] = {}
+    return json.dumps(_round_floats(payload), separators=(",", ":"))
+
+
+class FigureCache:
+    """Thread-safe cache of compact figure JSON, one entry per chart type.
+
+    An entry is rebuilt only when the hash of its source data changes, so
+    invalidation happens exactly when the data does.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries = {}  # chart_type -> (data_hash, payload_json, raw_bytes)
+
+    def get(self, chart_type, data):
+        key = data_hash(data)
+        entry = self._entries.get(chart_type)
+        if entry is not None and entry[0] == key:
+            return entry[1]
+
+        fig = build_figure(chart_type, data)
+        raw_bytes = len(pio.to_json(fig, validate=False).encode("utf-8"))
+        payload = compact_figure_json(fig)
+        with self._lock:
+            self._entries[chart_type] = (key, payload, raw_bytes)
+        return payload
+
+    def payload_report(self):
+        """Return ``[{chart_type, data_hash, raw_bytes, payload_bytes}, ...]``."""
+        with self._lock:
+            entries = sorted(self._entries.items())
+        return [
+            {
+                "chart_type": chart_type,
+                "data_hash": key,
+                "raw_bytes": raw_bytes,
+                "payload_bytes": len(payload.encode("utf-8")),
+            }
+            for chart_type, (key, payload, raw_bytes) in entries
+        ]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+figure_cache = FigureCache()
+
+
+def chart_payload(chart_type, data=SKILLS_DATA):
+    """Return the cached figure for ``chart_type`` as a plain dict."""
+    return json.loads(figure_cache.get(chart_type, data))
+
+
+_image_lock = threading.Lock()
+_images = {}  # (chart_type, data_hash) -> PNG bytes, or None if export failed
+_pending = set()  # keys being rendered in the background
+
+
+def _image_path(chart_type, key):
+    slug = chart_type.lower().replace(" ", "-")
+    return os.path.join(IMAGE_DIR, f"{slug}-{key}.png")
+
+
+def chart_image(chart_type, data=SKILLS_DATA):
+    """Return the figure as PNG bytes for lite mode, or None without kaleido.
+
+    Rendering starts kaleido and takes about a second, so this runs in
+    ``warm()`` and in background threads, never in a rerun; reruns use
+    ``cached_chart_image``.
+    """
+    key = (chart_type, data_hash(data))
+    if key in _images:
+        return _images[key]
+    with _image_lock:
+        if key in _images:
+            return _images[key]
+        path = _image_path(chart_type, key[1])
+        try:
+            with open(path, "rb") as f:
+                image = f.read()
+        except OSError:
+            width, height = IMAGE_SIZE
+            try:
+                image = pio.to_image(build_figure(chart_type, data), format="png", width=width, height=height)
+            except (ImportError, ValueError, RuntimeError):
+                # Static export needs the optional kaleido package (0.2.x;
+                # 1.x drives a local Chrome instead)
+                image = None
+            else:
+                try:
+                    os.makedirs(IMAGE_DIR, exist_ok=True)
+                    tmp_path = f"{path}.{os.getpid()}.tmp"
+                    with open(tmp_path, "wb") as f:
+                        f.write(image)
+                    os.replace(tmp_path, path)
+                except OSError:
+                    pass
+        _images[key] = image
+    return image
+
+
+def _render(chart_type, data, key):
+    try:
+        chart_image(chart_type, data)
+    finally:
+        with _image_lock:
+            _pending.discard(key)
+
+
+def cached_chart_image(chart_type, data=SKILLS_DATA):
+    """Return the PNG if it is already rendered, else None without blocking.
+
+    A missing image is rendered in a background thread, so the next rerun
+    after the data changes picks it up.
+    """
+    key = (chart_type, data_hash(data))
+    if key in _images:
+        return _images[key]
+    try:
+        with open(_image_path(chart_type, key[1]), "rb") as f:
+            image = _images[key] = f.read()
+        return image
+    except OSError:
+        pass
+    with _image_lock:
+        if key in _images:
+            return _images[key]
+        if key in _pending:
+            return None
+        _pending.add(key)
+    threading.Thread(target=_render, args=(chart_type, data, key),
+                     name="portfolio-chart-image", daemon=True).start()
+    return None
+
+
+def warm():
+    """Prebuild every chart type, and its lite-mode PNG, for the current data."""
+    from portfolio.experience import skills_data
+
+    data = skills_data()
+    for chart_type in CHART_TYPES:
+        figure_cache.get(chart_type, data)
+    for chart_type in CHART_TYPES:
+        chart_image(chart_type, data)
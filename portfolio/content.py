@@ -0,0 +1,219 @@
+"""Portfolio content shared by the Streamlit pages and the static export.
+
+The content lives in ``content/portfolio.yaml``, or in a JSON file with the
+same shape named by ``PORTFOLIO_CONTENT_FILE``. It is loaded once per
+process, checked against ``SCHEMA`` and frozen into namedtuples and tuples
+that all sessions share. The file's mtime is checked at most every
+``PORTFOLIO_CONTENT_CHECK_INTERVAL`` seconds. A changed file is loaded and
+validated in full, then swapped in with a single assignment, so a rerun
+sees either the old content or the new, never a mix of the two. If an edit
+is invalid, it is logged and the previous content stays live.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from collections import namedtuple
+
+from portfolio.documents import ROOT
+
+try:
+    import yaml
+except ImportError:  # JSON content files still work without PyYAML
+    yaml = None
+
+logger = logging.getLogger(__name__)
+
+CONTENT_FILE = os.environ.get("PORTFOLIO_CONTENT_FILE", os.path.join(ROOT, "content", "portfolio.yaml"))
+CHECK_INTERVAL = float(os.environ.get("PORTFOLIO_CONTENT_CHECK_INTERVAL", "2"))
+
+Hero = namedtuple("Hero", "name title tagline location phone")
+JourneyEntry = namedtuple("JourneyEntry", "year event")
+Certification = namedtuple("Certification", "title provider description skills")
+Project = namedtuple("Project", "title type description impact tech")
+# Pages key behaviour on ``id``; ``label`` is display text and free to change
+SkillCategory = namedtuple("SkillCategory", "id label")
+# Metric-style entries: project metrics and the sidebar stats
+Stat = namedtuple("Stat", "label value icon")
+Content = namedtuple("Content", [
+    "hero", "journey", "research_interests", "fun_facts", "skill_categories",
+    "molecular_skills", "tech_skills", "certifications", "projects",
+    "project_metrics", "sidebar_stats", "contact_reasons",
+])
+
+# Field types of each record: str, a record type, or [item type] for lists
+SCHEMA = {
+    Content: {
+        "hero": Hero,
+        "journey": [JourneyEntry],
+        "research_interests": str,
+        "fun_facts": [str],
+        "skill_categories": [SkillCategory],
+        "molecular_skills": [str],
+        "tech_skills": [str],
+        "certifications": [Certification],
+        "projects": [Project],
+        "project_metrics": [Stat],
+        "sidebar_stats": [[Stat]],  # rows of stats
+        "contact_reasons": [str],
+    },
+    Hero: dict.fromkeys(Hero._fields, str),
+    JourneyEntry: dict.fromkeys(JourneyEntry._fields, str),
+    Certification: {"title": str, "provider": str, "description": str, "skills": [str]},
+    Project: {"title": str, "type": str, "description": str, "impact": str, "tech": [str]},
+    Stat: dict.fromkeys(Stat._fields, str),
+    SkillCategory: dict.fromkeys(SkillCategory._fields, str),
+}
+
+
+class ContentError(ValueError):
+    """The content file is missing, unparsable or does not match SCHEMA."""
+
+
+def freeze(spec, value, where):
+    """Validate ``value`` against ``spec`` and return an immutable copy."""
+    if spec is str:
+        if not isinstance(value, str):
+            raise ContentError(f"{where}: expected text, got {type(value).__name__} (quote numbers)")
+        return value
+    if isinstance(spec, list):
+        if not isinstance(value, list):
+            raise ContentError(f"{where}: expected a list, got {type(value).__name__}")
+        return tuple(freeze(spec[0], item, f"{where}[{i}]") for i, item in enumerate(value))
+    fields = SCHEMA[spec]
+    if not isinstance(value, dict):
+        raise ContentError(f"{where}: expected a mapping, got {type(value).__name__}")
+    missing = fields.keys() - value.keys()
+    unknown = value.keys() - fields.keys()
+    if missing or unknown:
+        raise ContentError(f"{where}: missing {sorted(missing)}, unknown {sorted(unknown)}")
+    return spec(**{name: freeze(field, value[name], f"{where}.{name}") for name, field in fields.items()})
+
+
+def load(path=CONTENT_FILE):
+    """Parse and validate a YAML or JSON content file into a ``Content``."""
+    is_json = path.endswith(".json")
+    if not is_json and yaml is None:
+        raise ContentError(f"{path}: PyYAML is required for YAML content")
+    with open(path, "rb") as f:
+        raw = f.read()
+    try:
+        if is_json:
+            doc = json.loads(raw)
+        else:
+            doc = yaml.load(raw, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+    except (ValueError, yaml.YAMLError if yaml else ValueError) as exc:
+        raise ContentError(f"{path}: {exc}") from exc
+    content = freeze(Content, doc, os.path.basename(path))
+    ids = [category.id for category in content.skill_categories]
+    if len(set(ids)) != len(ids):
+        raise ContentError(f"{os.path.basename(path)}.skill_categories: duplicate id in {ids}")
+    return content
+
+
+class ContentRegistry:
+    """The live ``Content`` snapshot, reloaded when its file changes."""
+
+    def __init__(self, path=CONTENT_FILE, check_interval=CHECK_INTERVAL):
+        self.path = path
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._snapshot = None
+        self._version = None  # (mtime_ns, size) of the file last loaded
+        self._checked = 0.0
+
+    @property
+    def version(self):
+        self.current()
+        return self._version
+
+    def current(self):
+        """Return the current snapshot; never a partially loaded one."""
+        snapshot = self._snapshot
+        if snapshot is None or time.monotonic() - self._checked >= self.check_interval:
+            snapshot = self._refresh()
+        return snapshot
+
+    def _refresh(self):
+        with self._lock:
+            if self._snapshot is not None and time.monotonic() - self._checked < self.check_interval:
+                return self._snapshot
+            self._checked = time.monotonic()
+            try:
+                stat = os.stat(self.path)
+            except OSError:
+                # An editor may briefly remove the file while saving
+                if self._snapshot is None:
+                    raise
+                return self._snapshot
+            version = (stat.st_mtime_ns, stat.st_size)
+            if version == self._version:
+                return self._snapshot
+            try:
+                snapshot = load(self.path)
+            except (OSError, ContentError) as exc:
+                if self._snapshot is None:
+                    raise
+                # Keep serving the last good content until the file changes again
+                logger.warning("Keeping previous content; could not reload %s: %s", self.path, exc)
+                self._version = version
+                return self._snapshot
+            # One reference assignment publishes the new content
+            self._snapshot = snapshot
+            self._version = version
+            return snapshot
+
+
+registry = ContentRegistry()
+
+
+# Accessors used by the pages; each returns shared, immutable data
+
+def hero():
+    return registry.current().hero
+
+
+def journey():
+    return registry.current().journey
+
+
+def research_interests():
+    return registry.current().research_interests
+
+
+def fun_facts():
+    return registry.current().fun_facts
+
+
+def skill_categories():
+    return registry.current().skill_categories
+
+
+def molecular_skills():
+    return registry.current().molecular_skills
+
+
+def tech_skills():
+    return registry.current().tech_skills
+
+
+def certifications():
+    return registry.current().certifications
+
+
+def projects():
+    return registry.current().projects
+
+
+def project_metrics():
+    return registry.current().project_metrics
+
+
+def sidebar_stats():
+    return registry.current().sidebar_stats
+
+
+def contact_reasons():
+    return registry.current().contact_reasons
@@ -0,0 +1,132 @@
+"""Shared visitor counters: unique sessions, page views and quiz completions.
+
+Increments only touch process memory. A background thread flushes the
+accumulated deltas to SQLite every ``FLUSH_INTERVAL`` seconds (sooner once
+``FLUSH_BATCH`` increments are pending) with atomic ``value = value + ?``
+upserts, so any number of server processes sharing the database file
+add up correctly. Reads never touch the database: they combine the totals
+loaded at the last flush with this process's unflushed deltas.
+"""
+
+import atexit
+import contextlib
+import threading
+from collections import Counter
+
+from portfolio.db import connect
+
+FLUSH_INTERVAL = 10  # seconds
+FLUSH_BATCH = 100
+
+SESSIONS = "sessions"
+QUIZ_COMPLETIONS = "quiz_completions"
+VIEW_PREFIX = "views:"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS {table} (
+    key TEXT PRIMARY KEY,
+    value INTEGER NOT NULL DEFAULT 0
+)
+"""
+
+
+def view_key(menu_option):
+    return f"{VIEW_PREFIX}{menu_option}"
+
+
+class CounterService:
+    def __init__(self, db_path=None, table="counters", flush_interval=FLUSH_INTERVAL, flush_batch=FLUSH_BATCH):
+        self._db_path = db_path
+        self._table = table
+        self._flush_interval = flush_interval
+        self._flush_batch = flush_batch
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._pending = Counter()
+        self._pending_events = 0
+        self._totals = {}  # replaced wholesale on each flush
+        self._loaded = False
+        self._wake = threading.Event()
+        self._thread = None
+
+    @contextlib.contextmanager
+    def _conn(self):
+        with connect(self._db_path) as conn:
+            conn.execute(SCHEMA.format(table=self._table))
+            yield conn
+
+    def increment(self, key, amount=1):
+        with self._lock:
+            self._pending[key] += amount
+            self._pending_events += 1
+            full = self._pending_events >= self._flush_batch
+        self._ensure_thread()
+        if full:
+            self._wake.set()
+
+    def value(self, key):
+        if not self._loaded:
+            self.refresh()
+        return self._totals.get(key, 0) + self._pending.get(key, 0)
+
+    def snapshot(self):
+        """Return ``{key: value}`` for every counter, from memory."""
+        if not self._loaded:
+            self.refresh()
+        totals, pending = self._totals, dict(self._pending)
+        return {key: totals.get(key, 0) + pending.get(key, 0) for key in totals.keys() | pending.keys()}
+
+    def page_views(self):
+        return {key[len(VIEW_PREFIX):]: value for key, value in self.snapshot().items()
+                if key.startswith(VIEW_PREFIX)}
+
+    def refresh(self):
+        """Reload totals from the database (including other processes' flushes)."""
+        with self._conn() as conn:
+            rows = conn.execute(f"SELECT key, value FROM {self._table}").fetchall()
+        self._totals = {row["key"]: row["value"] for row in rows}
+        self._loaded = True
+
+    def flush(self):
+        """Write pending deltas to the database and refresh the totals."""
+        with self._flush_lock:
+            with self._lock:
+                pending, self._pending = self._pending, Counter()
+                self._pending_events = 0
+            if pending:
+                try:
+                    with self._conn() as conn:
+                        conn.execute("BEGIN IMMEDIATE")
+                        conn.executemany(
+                            f"INSERT INTO {self._table} (key, value) VALUES (?, ?)"
+                            " ON CONFLICT(key) DO UPDATE SET value = value + excluded.value",
+                            list(pending.items()),
+                        )
+                        conn.execute("COMMIT")
+                except Exception:
+                    # Rolled back by connect(); put the deltas back so the
+                    # next flush retries them
+                    with self._lock:
+                        self._pending.update(pending)
+                    raise
+            self.refresh()
+
+    def _run(self):
+        while True:
+            self._wake.wait(self._flush_interval)
+            self._wake.clear()
+            try:
+                self.flush()
+            except Exception:
+                pass
+
+    def _ensure_thread(self):
+        if self._thread is None:
+            with self._lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(target=self._run, name=f"portfolio-{self._table}", daemon=True)
+                    self._thread.start()
+                    atexit.register(self.flush)
+
+
+counters = CounterService()
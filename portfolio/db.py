@@ -0,0 +1,63 @@
+"""SQLite helpers shared by the services that persist data.
+
+All services keep their tables in one database file under ``DATA_DIR``
+(``PORTFOLIO_DATA_DIR`` overrides it). WAL mode lets several server
+processes read while one writes. Within a process, connections come from a
+small pool: Streamlit runs every rerun on a fresh thread, so per-thread
+connections would be opened (and leaked) once per rerun.
+"""
+
+import contextlib
+import os
+import sqlite3
+import threading
+
+from portfolio.documents import ROOT
+
+DATA_DIR = os.environ.get("PORTFOLIO_DATA_DIR", os.path.join(ROOT, ".data"))
+DB_PATH = os.path.join(DATA_DIR, "portfolio.sqlite3")
+
+# Idle connections kept per database; more are opened under load and
+# closed when they are handed back to a full pool
+POOL_SIZE = 4
+
+_pool_lock = threading.Lock()
+_pools = {}  # path -> [idle connections]
+
+
+def _open(path):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    # Autocommit; writers open explicit transactions when they need one.
+    # A pooled connection moves between threads, but only one uses it at a time.
+    conn = sqlite3.connect(path, timeout=10, isolation_level=None, check_same_thread=False)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA busy_timeout=10000")
+    return conn
+
+
+@contextlib.contextmanager
+def connect(path=None):
+    """Borrow a connection to ``path`` (default: the shared database).
+
+    Use as ``with connect() as conn:``; the connection goes back to the
+    pool when the block exits, rolled back if a transaction was left open.
+    """
+    path = path or DB_PATH
+    with _pool_lock:
+        idle = _pools.setdefault(path, [])
+        conn = idle.pop() if idle else None
+    if conn is None:
+        conn = _open(path)
+    try:
+        yield conn
+    finally:
+        if conn.in_transaction:
+            conn.execute("ROLLBACK")
+        with _pool_lock:
+            if len(idle) < POOL_SIZE:
+                idle.append(conn)
+                conn = None
+        if conn is not None:
+            conn.close()
@@ -0,0 +1,165 @@
+"""Shared download cache for the documents in ``assets/``.
+
+A manifest (size, mtime, sha256) is built once per process. File bytes are
+read on first request and the resulting ``bytes`` object is shared by every
+session, so fifty visitors downloading the poster hold one copy, not fifty;
+Streamlit's media store also dedupes by content. An entry is reloaded when
+the file's mtime changes, and dropped when the file is deleted.
+"""
+
+import gzip
+import hashlib
+import os
+import threading
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ASSETS_DIR = os.path.join(ROOT, "assets")
+
+# File in assets/ -> (label, mime type)
+DOCUMENTS = {
+    "Resume.pdf": ("📄 Resume (PDF)", "application/pdf"),
+    "Resume.docx": ("📝 Resume (Word)", "application/vnd.openxmlformats-officedocument.wordprocessingml.document"),
+    "poster final EDIT 5 #.pdf": ("🖼 Research Poster", "application/pdf"),
+    "final #3.pdf": ("📘 Thesis", "application/pdf"),
+    "212225 final.pdf": ("📑 Final Report", "application/pdf"),
+}
+
+# Formats that are already compressed internally and never gain from gzip
+INCOMPRESSIBLE = {".docx", ".xlsx", ".pptx", ".zip", ".png", ".jpg", ".jpeg", ".webp", ".gz"}
+# Keep a gzip variant only if it is at least this much smaller
+MIN_GZIP_SAVING = 0.10
+
+
+class DocumentInfo:
+    __slots__ = ("name", "label", "mime", "path", "size", "mtime", "sha256")
+
+    def __init__(self, name, label, mime, path, size, mtime, sha256):
+        self.name = name
+        self.label = label
+        self.mime = mime
+        self.path = path
+        self.size = size
+        self.mtime = mtime
+        self.sha256 = sha256
+
+
+def _sha256(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _describe(name, stat=None):
+    label, mime = DOCUMENTS[name]
+    path = os.path.join(ASSETS_DIR, name)
+    stat = stat or os.stat(path)
+    return DocumentInfo(name, label, mime, path, stat.st_size, stat.st_mtime, _sha256(path))
+
+
+class DocumentStore:
+    """Process-wide manifest and byte cache for downloadable documents."""
+
+    def __init__(self, documents=DOCUMENTS, precompress=True):
+        self._documents = documents
+        self._precompress = precompress
+        self._lock = threading.Lock()
+        self._manifest = None
+        self._bytes = {}  # name -> (mtime, bytes)
+        self._gzipped = {}  # name -> (mtime, bytes or None)
+
+    def manifest(self):
+        """Return ``{name: DocumentInfo}`` for every document that exists."""
+        if self._manifest is None:
+            with self._lock:
+                if self._manifest is None:
+                    manifest = {}
+                    for name in self._documents:
+                        try:
+                            manifest[name] = _describe(name)
+                        except FileNotFoundError:
+                            continue
+                    self._manifest = manifest
+        return self._manifest
+
+    def _drop(self, name):
+        """Forget a document whose file has been deleted."""
+        with self._lock:
+            # Copy-on-write so readers iterating the manifest are unaffected
+            self._manifest = {key: info for key, info in self._manifest.items() if key != name}
+            self._bytes.pop(name, None)
+            self._gzipped.pop(name, None)
+
+    def info(self, name):
+        """Return the manifest entry for ``name``, refreshed if its mtime changed.
+
+        Returns None if the file has been deleted since the manifest was built.
+        """
+        info = self.manifest().get(name)
+        if info is None:
+            return None
+        try:
+            stat = os.stat(info.path)
+            if stat.st_mtime != info.mtime or stat.st_size != info.size:
+                with self._lock:
+                    info = _describe(name, stat)
+                    self._manifest = {**self._manifest, name: info}
+                    self._bytes.pop(name, None)
+                    self._gzipped.pop(name, None)
+        except FileNotFoundError:
+            self._drop(name)
+            return None
+        return info
+
+    def read(self, name):
+        """Return the file's bytes, shared across sessions, or None if it is gone."""
+        info = self.info(name)
+        if info is None:
+            return None
+        cached = self._bytes.get(name)
+        if cached is not None and cached[0] == info.mtime:
+            return cached[1]
+        try:
+            with self._lock:
+                cached = self._bytes.get(name)
+                if cached is None or cached[0] != info.mtime:
+                    with open(info.path, "rb") as f:
+                        cached = self._bytes[name] = (info.mtime, f.read())
+        except FileNotFoundError:
+            self._drop(name)
+            return None
+        return cached[1]
+
+    def gzipped(self, name):
+        """Return a gzip variant of the file, or None if it would not help."""
+        if not self._precompress:
+            return None
+        info = self.info(name)
+        if info is None or os.path.splitext(name)[1].lower() in INCOMPRESSIBLE:
+            return None
+        cached = self._gzipped.get(name)
+        if cached is not None and cached[0] == info.mtime:
+            return cached[1]
+        data = self.read(name)
+        if data is None:
+            return None
+        compressed = gzip.compress(data, compresslevel=9, mtime=0)
+        if len(compressed) > len(data) * (1 - MIN_GZIP_SAVING):
+            compressed = None
+        with self._lock:
+            self._gzipped[name] = (info.mtime, compressed)
+        return compressed
+
+    def cached_bytes(self):
+        """Total bytes currently held by the cache (raw plus gzip variants)."""
+        total = sum(len(data) for _, data in self._bytes.values())
+        return total + sum(len(data) for _, data in self._gzipped.values() if data)
+
+
+document_store = DocumentStore()
+
+
+def warm():
+    """Build the manifest; run from the startup warm-up thread."""
+    document_store.manifest()
@@ -0,0 +1,145 @@
+"""Skills Chart data aggregated from the append-only experience log.
+
+``content/experience_log.csv`` has one row per lab session or project
+(``date,skill,hours,outcome``). Per-skill totals are aggregated with
+vectorized pandas/NumPy and kept in memory with the byte offset they
+cover. When the file grows, only the appended rows are read and merged;
+when it shrinks or is rewritten (or is a Parquet file) it is aggregated
+from scratch. Results are cached until the file's mtime or size changes.
+"""
+
+import io
+import os
+import threading
+
+from portfolio.documents import ROOT
+from portfolio.lazy import lazy_import
+
+np = lazy_import("numpy")
+pd = lazy_import("pandas")
+
+LOG_PATH = os.environ.get("PORTFOLIO_EXPERIENCE_LOG", os.path.join(ROOT, "content", "experience_log.csv"))
+COLUMNS = ["date", "skill", "hours", "outcome"]
+# Hours of practice that, with a perfect success rate, reach level 10
+HOURS_FOR_MASTERY = 400
+DAYS_PER_MONTH = 30.44
+
+
+def aggregate(rows):
+    """Per-skill totals of a log DataFrame (vectorized groupby)."""
+    rows = rows.assign(
+        date=pd.to_datetime(rows["date"]),
+        hours=pd.to_numeric(rows["hours"], errors="coerce").fillna(0.0),
+        success=rows["outcome"].astype(str).str.strip().str.lower().eq("success"),
+    )
+    return rows.groupby("skill").agg(
+        hours=("hours", "sum"),
+        sessions=("hours", "size"),
+        successes=("success", "sum"),
+        first=("date", "min"),
+        last=("date", "max"),
+    )
+
+
+def merge(totals, delta):
+    if totals is None:
+        return delta
+    return pd.concat([totals, delta]).groupby(level=0).agg(
+        {"hours": "sum", "sessions": "sum", "successes": "sum", "first": "min", "last": "max"}
+    )
+
+
+def skills_frame(totals):
+    """Turn totals into the chart's proficiency/experience columns."""
+    hours = totals["hours"].to_numpy(dtype=float)
+    success_rate = totals["successes"].to_numpy(dtype=float) / np.maximum(totals["sessions"].to_numpy(), 1)
+    proficiency = 1 + 9 * np.log1p(hours) / np.log1p(HOURS_FOR_MASTERY) * (0.6 + 0.4 * success_rate)
+    months = (totals["last"] - totals["first"]).dt.days.to_numpy() / DAYS_PER_MONTH
+    return pd.DataFrame({
+        "Skill Category": totals.index.to_numpy(),
+        "Proficiency Level": np.clip(np.rint(proficiency), 1, 10).astype(int),
+        "Experience (Months)": np.rint(months).astype(int),
+        "Hours": np.rint(hours).astype(int),
+        "Sessions": totals["sessions"].to_numpy(dtype=int),
+    })
+
+
+class ExperienceLog:
+    def __init__(self, path=LOG_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._version = None  # (mtime_ns, size) the cached result is for
+        self._offset = 0  # bytes of the CSV already aggregated
+        self._head = b""  # first line, to detect a rewritten file
+        self._totals = None
+        self._data = None
+
+    def _read_full(self):
+        if self.path.endswith(".parquet"):
+            rows = pd.read_parquet(self.path, columns=COLUMNS)
+            self._offset = 0
+        else:
+            with open(self.path, "rb") as f:
+                raw = f.read()
+            end = raw.rfind(b"\n") + 1
+            self._offset = end
+            self._head = raw[:raw.find(b"\n") + 1]
+            if not end:
+                self._totals = None
+                return
+            rows = pd.read_csv(io.BytesIO(raw[:end]), usecols=COLUMNS)
+        self._totals = aggregate(rows) if len(rows) else None
+
+    def _read_appended(self):
+        """Aggregate only the complete lines appended since the last read."""
+        with open(self.path, "rb") as f:
+            if not self._head or f.read(len(self._head)) != self._head:
+                return False
+            f.seek(self._offset)
+            raw = f.read()
+        end = raw.rfind(b"\n") + 1
+        if end:
+            rows = pd.read_csv(io.BytesIO(self._head + raw[:end]), usecols=COLUMNS)
+            if len(rows):
+                self._totals = merge(self._totals, aggregate(rows))
+            self._offset += end
+        return True
+
+    def data(self):
+        """Return chart data as ``{column: [values]}``, or None without a log."""
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        version = (stat.st_mtime_ns, stat.st_size)
+        if version == self._version:
+            return self._data
+        with self._lock:
+            if version != self._version:
+                incremental = (
+                    self._version is not None
+                    and not self.path.endswith(".parquet")
+                    and stat.st_size >= self._offset
+                    and self._read_appended()
+                )
+                if not incremental:
+                    self._read_full()
+                frame = skills_frame(self._totals) if self._totals is not None else None
+                self._data = frame.to_dict(orient="list") if frame is not None else None
+                self._version = version
+        return self._data
+
+
+experience_log = ExperienceLog()
+
+
+def skills_data():
+    """Chart data from the experience log, or the built-in defaults."""
+    from portfolio.charts import SKILLS_DATA
+
+    return experience_log.data() or SKILLS_DATA
+
+
+def warm():
+    """Aggregate the log ahead of the first Skills Chart view."""
+    experience_log.data()
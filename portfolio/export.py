@@ -0,0 +1,213 @@
+"""Static HTML export of the read-only sections.
+
+Renders Home, About Me, Certifications, Projects and Skills Chart from
+``portfolio.content`` and the figure cache into a directory that any file
+server or CDN can host: minified theme CSS inlined in every page, plotly
+figures embedded as JSON, and assets (the theme's web fonts included)
+copied under content-hashed names. The quiz and contact form link back to
+the live Streamlit app.
+"""
+
+import html
+import json
+import os
+import shutil
+
+from portfolio.charts import CHART_TYPES, chart_payload
+from portfolio.content import registry
+from portfolio.documents import ASSETS_DIR
+from portfolio.experience import skills_data
+from portfolio.images import output_extension, profile_photo, responsive_image
+from portfolio.static_assets import FONT_FACES, FONTS_DIR, content_hash, font_face_rule, minify_css
+
+# (file, nav label); the first page is index.html
+PAGES = [
+    ("index.html", "🏠 Home"),
+    ("about.html", "👨‍🔬 About Me"),
+    ("certifications.html", "🏅 Certifications"),
+    ("projects.html", "💼 Projects"),
+    ("skills-chart.html", "📊 Skills Chart"),
+]
+# Interactive sections stay on the Streamlit server: (page module, nav label)
+LIVE_PAGES = [
+    ("quiz", "🎯 Interactive Quiz"),
+    ("contact", "📞 Contact"),
+]
+
+EXTRA_CSS = """
+body{margin:0;background:#fafdf7;color:#1b2e1c}
+nav{display:flex;flex-wrap:wrap;gap:.5rem;padding:1rem;background:#1b5e20}
+nav a{color:#fff;text-decoration:none;padding:.3rem .8rem;border-radius:20px}
+nav a.active,nav a:hover{background:#4caf50}
+main{max-width:1100px;margin:0 auto;padding:2rem 1rem}
+.metrics{display:flex;gap:1rem;flex-wrap:wrap}
+.chart{min-height:450px;margin-bottom:2rem}
+"""
+E = html.escape
+# Written into every export, so a later export knows it may replace the directory
+MARKER = ".portfolio-export"
+
+
+class ExportError(Exception):
+    pass
+
+
+class Exporter:
+    def __init__(self, out_dir, app_url, force=False):
+        self.out_dir = out_dir
+        self.app_url = app_url.rstrip("/")
+        self.force = force
+        self.css = None
+        # One snapshot for the whole export, even if the content file changes
+        self.content = registry.current()
+
+    def write_asset(self, name, data):
+        """Write ``data`` under ``assets/<stem>.<hash><ext>`` and return its URL."""
+        stem, ext = os.path.splitext(name)
+        filename = f"{stem}.{content_hash(data)}{ext}"
+        path = os.path.join(self.out_dir, "assets", filename)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(data)
+        return f"assets/{filename}"
+
+    def font_faces(self):
+        """Copy the web fonts as hashed assets; return their ``@font-face`` rules."""
+        rules = []
+        for weight, filename in FONT_FACES:
+            try:
+                with open(os.path.join(FONTS_DIR, filename), "rb") as f:
+                    url = self.write_asset(filename, f.read())
+            except FileNotFoundError:
+                continue
+            rules.append(font_face_rule(weight, url))
+        return "".join(rules)
+
+    def plotly_js(self):
+        import plotly
+
+        path = os.path.join(os.path.dirname(plotly.__file__), "package_data", "plotly.min.js")
+        with open(path, "rb") as f:
+            return self.write_asset("plotly.min.js", f.read())
+
+    def layout(self, current, title, body, scripts=""):
+        links = []
+        for filename, label in PAGES:
+            active = ' class="active"' if filename == current else ""
+            links.append(f'<a href="{filename}"{active}>{E(label)}</a>')
+        for module, label in LIVE_PAGES:
+            links.append(f'<a href="{E(self.app_url)}/?section={module}">{E(label)}</a>')
+        return (
+            '<!doctype html><html lang="en"><head><meta charset="utf-8">'
+            '<meta name="viewport" content="width=device-width,initial-scale=1">'
+            f"<title>{E(title)} · {E(self.content.hero.name)}</title>"
+            f"<style>{self.css}</style></head><body>"
+            f"<nav>{''.join(links)}</nav><main>{body}</main>"
+            '<footer style="text-align:center;color:#4caf50;padding:2rem 0">'
+            f"<p>© 2025 {E(self.content.hero.name)} | Built with ❤ using Streamlit</p>"
+            "<p>🧬 <em>Pioneering biotechnology for a healthier future</em></p></footer>"
+            f"{scripts}</body></html>"
+        )
+
+    def home(self):
+        photo_url = self.write_asset(f"profile.{output_extension()}", responsive_image(profile_photo(), 300))
+        return (
+            '<div class="main-header"><div class="floating-icon">🧬</div>'
+            f"<h1>{E(self.content.hero.name)}</h1><h3>{E(self.content.hero.title)}</h3>"
+            f"<p>{E(self.content.hero.tagline)}</p>"
+            f"<p>📍 {E(self.content.hero.location)} | 📞 {E(self.content.hero.phone)}</p>"
+            "<p><strong>Welcome to my Biotech Portfolio!</strong></p></div>"
+            f'<p style="text-align:center"><img src="{photo_url}" width="300" alt="Profile photo"></p>'
+        )
+
+    def about(self):
+        journey = "".join(f"<li><strong>{E(year)}</strong> - {E(event)}</li>" for year, event in self.content.journey)
+        facts = "".join(f"<li>{E(fact)}</li>" for fact in self.content.fun_facts)
+        return (
+            '<h2 class="section-header">🎯 About Me</h2>'
+            f"<h3>🎓 My Biotech Journey</h3><ul>{journey}</ul>"
+            f"<h3>🔬 My Research Interests</h3><p>{E(self.content.research_interests)}</p>"
+            f"<h3>⚡ Biotech Fun Facts</h3><ul>{facts}</ul>"
+        )
+
+    def certifications(self):
+        cards = []
+        for cert in self.content.certifications:
+            skills = "".join(f"<li>{E(skill)}</li>" for skill in cert.skills)
+            cards.append(
+                f'<div class="certification-card"><h3>{E(cert.title)} - {E(cert.provider)}</h3>'
+                f"<p>{E(cert.description)}</p><p><em>Skills Gained:</em></p><ul>{skills}</ul></div>"
+            )
+        return '<h2 class="section-header">🏅 Biotech Certifications</h2>' + "".join(cards)
+
+    def projects(self):
+        cards = []
+        for project in self.content.projects:
+            tech = "".join(f'<span class="skill-tag">{E(t)}</span>' for t in project.tech)
+            cards.append(
+                f'<div class="project-card"><h3>{E(project.title)}</h3>'
+                f"<p><em>Type:</em> {E(project.type)}</p>"
+                f"<p><em>Description:</em> {E(project.description)}</p>"
+                f"<p><em>Impact:</em> {E(project.impact)}</p><div>{tech}</div></div>"
+            )
+        metrics = "".join(
+            f'<div class="stats-card"><div>{E(icon)} {E(label)}</div><strong>{E(value)}</strong></div>'
+            for label, value, icon in self.content.project_metrics
+        )
+        return ('<h2 class="section-header">💼 Biotech Project Showcase</h2>' + "".join(cards)
+                + f'<h3>📊 Project Metrics</h3><div class="metrics">{metrics}</div>')
+
+    def skills_chart(self):
+        blocks = []
+        figures = {}
+        for number, chart_type in enumerate(CHART_TYPES):
+            element_id = f"chart-{number}"
+            figures[element_id] = chart_payload(chart_type, skills_data())
+            blocks.append(f'<h3>{E(chart_type)}</h3><div class="chart" id="{element_id}"></div>')
+        # </ cannot appear inside a <script> block
+        data = json.dumps(figures, separators=(",", ":")).replace("</", "<\\/")
+        scripts = (
+            f'<script src="{self.plotly_js()}"></script>'
+            f'<script type="application/json" id="figures">{data}</script>'
+            "<script>var figs=JSON.parse(document.getElementById('figures').textContent);"
+            "for(var id in figs){Plotly.newPlot(id,figs[id].data,figs[id].layout,{responsive:true});}</script>"
+        )
+        return '<h2 class="section-header">📊 Biotech Skills Visualization</h2>' + "".join(blocks), scripts
+
+    def prepare(self):
+        """Empty the output directory, refusing one that is not a previous export."""
+        if not os.path.isdir(self.out_dir):
+            os.makedirs(self.out_dir)
+        elif os.listdir(self.out_dir):
+            if not (self.force or os.path.exists(os.path.join(self.out_dir, MARKER))):
+                raise ExportError(f"{self.out_dir} is not empty and is not a previous export; "
+                                  "pass --force to replace it")
+            shutil.rmtree(self.out_dir)
+            os.makedirs(self.out_dir)
+        with open(os.path.join(self.out_dir, MARKER), "w", encoding="utf-8") as f:
+            f.write("Generated by scripts/export_static.py; replaced on the next export.\n")
+
+    def export(self):
+        """Write the static site; return the list of files written."""
+        self.prepare()
+        with open(os.path.join(ASSETS_DIR, "theme.css"), encoding="utf-8") as f:
+            self.css = self.font_faces() + minify_css(f.read() + EXTRA_CSS)
+
+        renderers = {
+            "index.html": self.home,
+            "about.html": self.about,
+            "certifications.html": self.certifications,
+            "projects.html": self.projects,
+            "skills-chart.html": self.skills_chart,
+        }
+        for filename, label in PAGES:
+            rendered = renderers[filename]()
+            body, scripts = rendered if isinstance(rendered, tuple) else (rendered, "")
+            with open(os.path.join(self.out_dir, filename), "w", encoding="utf-8") as f:
+                f.write(self.layout(filename, label.split(" ", 1)[1], body, scripts))
+
+        written = []
+        for directory, _, files in os.walk(self.out_dir):
+            written += [os.path.relpath(os.path.join(directory, name), self.out_dir)
+                        for name in files if name != MARKER]
+        return sorted(written)
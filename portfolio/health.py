@@ -0,0 +1,34 @@
+"""Liveness and readiness of one server process.
+
+A replica is live as soon as it can answer. It is ready once the warm-up
+thread has finished: heavy modules imported, page modules loaded, chart
+figures prebuilt, documents, images and the search index cached. The
+metrics HTTP server (``PORTFOLIO_METRICS_PORT``) serves both probes as
+``/healthz`` and ``/readyz``, and the replica proxy only routes to ready
+replicas.
+"""
+
+import os
+import time
+
+from portfolio.lazy import warmup_status
+
+STARTED = time.time()
+
+
+def readiness():
+    """Return ``{ready, pid, uptime_s, warmup_failed, content_version}``."""
+    finished, failed = warmup_status()
+    try:
+        from portfolio.content import registry
+
+        content_version = list(registry.version)
+    except (OSError, ValueError):
+        content_version = None
+    return {
+        "ready": finished,
+        "pid": os.getpid(),
+        "uptime_s": round(time.time() - STARTED, 1),
+        "warmup_failed": failed,
+        "content_version": content_version,
+    }
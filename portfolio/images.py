@@ -0,0 +1,129 @@
+"""Responsive variants of the local photos in ``assets/``.
+
+Each source image is decoded once, resized to a few fixed widths and
+encoded as WebP (JPEG when Pillow lacks WebP). Variants are written to
+``.cache/images/`` keyed by the source's sha256, and recently served ones
+are kept in a bounded in-memory LRU, so reruns never decode the original.
+"""
+
+import functools
+import hashlib
+import os
+import tempfile
+import threading
+
+from portfolio.documents import ASSETS_DIR, ROOT
+
+CACHE_DIR = os.path.join(ROOT, ".cache", "images")
+WIDTHS = (150, 300, 600)
+# Browsers on high-density screens need twice the CSS width
+DEVICE_PIXEL_RATIO = 2
+WEBP_QUALITY = 80
+JPEG_QUALITY = 82
+MEMORY_CACHE_SIZE = 16
+
+# First match in assets/ is used as the profile photo
+PROFILE_PHOTO_NAMES = ("profile.webp", "profile.jpg", "profile.jpeg", "profile.png")
+
+_lock = threading.Lock()
+_hashes = {}  # path -> (mtime, sha256)
+
+
+def _output_format():
+    from PIL import features
+
+    return ("WEBP", "webp") if features.check("webp") else ("JPEG", "jpg")
+
+
+def output_extension():
+    return _output_format()[1]
+
+
+def source_hash(path):
+    mtime = os.stat(path).st_mtime
+    cached = _hashes.get(path)
+    if cached is None or cached[0] != mtime:
+        with open(path, "rb") as f:
+            cached = _hashes[path] = (mtime, hashlib.sha256(f.read()).hexdigest()[:16])
+    return cached[1]
+
+
+def _variant_path(digest, width, ext):
+    return os.path.join(CACHE_DIR, f"{digest}-{width}.{ext}")
+
+
+def build_variants(path):
+    """Decode ``path`` once and write every missing width to the disk cache."""
+    from PIL import Image, ImageOps
+
+    digest = source_hash(path)
+    image_format, ext = _output_format()
+    missing = [w for w in WIDTHS if not os.path.exists(_variant_path(digest, w, ext))]
+    if not missing:
+        return
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    with Image.open(path) as original:
+        original = ImageOps.exif_transpose(original).convert("RGB")
+        for width in missing:
+            height = round(original.height * min(width, original.width) / original.width)
+            resized = original.resize((min(width, original.width), height), Image.LANCZOS)
+            fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix=f".{ext}")
+            with os.fdopen(fd, "wb") as f:
+                if image_format == "WEBP":
+                    resized.save(f, "WEBP", quality=WEBP_QUALITY, method=6)
+                else:
+                    resized.save(f, "JPEG", quality=JPEG_QUALITY, optimize=True, progressive=True)
+            os.replace(tmp_path, _variant_path(digest, width, ext))
+
+
+@functools.lru_cache(maxsize=MEMORY_CACHE_SIZE)
+def _load_variant(path, digest, width):
+    _, ext = _output_format()
+    variant_path = _variant_path(digest, width, ext)
+    if not os.path.exists(variant_path):
+        with _lock:
+            build_variants(path)
+    with open(variant_path, "rb") as f:
+        return f.read()
+
+
+def pick_width(display_width):
+    wanted = display_width * DEVICE_PIXEL_RATIO
+    return next((w for w in WIDTHS if w >= wanted), WIDTHS[-1])
+
+
+def responsive_image(path, display_width):
+    """Return encoded bytes of the variant of ``path`` best suited to ``display_width``."""
+    return _load_variant(path, source_hash(path), pick_width(display_width))
+
+
+def _placeholder(path, size=600):
+    """Draw the old placeholder card locally instead of fetching it."""
+    from PIL import Image, ImageDraw
+
+    image = Image.new("RGB", (size, size), "#4caf50")
+    draw = ImageDraw.Draw(image)
+    text = "Biotech Profile Photo"
+    left, top, right, bottom = draw.textbbox((0, 0), text)
+    draw.text(((size - (right - left)) / 2, (size - (bottom - top)) / 2), text, fill="#FFFFFF")
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    image.save(path, "PNG")
+
+
+def profile_photo():
+    """Path of the profile photo, generating a local placeholder if there is none."""
+    for name in PROFILE_PHOTO_NAMES:
+        path = os.path.join(ASSETS_DIR, name)
+        if os.path.exists(path):
+            return path
+    path = os.path.join(CACHE_DIR, "profile-placeholder.png")
+    if not os.path.exists(path):
+        with _lock:
+            if not os.path.exists(path):
+                _placeholder(path)
+    return path
+
+
+def warm():
+    """Prebuild the profile photo variants; run from the startup warm-up thread."""
+    build_variants(profile_photo())
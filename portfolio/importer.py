@@ -0,0 +1,219 @@
+"""Background importer for profile and publication data.
+
+Sources are configured in ``content/sources.json`` (``PORTFOLIO_SOURCES_FILE``
+overrides it, e.g. to point at a local stand-in server in tests). A
+daemon thread refreshes each source when its TTL expires, through one
+pooled ``requests.Session`` that sends ``If-None-Match`` /
+``If-Modified-Since`` so unchanged pages come back as a bodiless 304.
+Pages are parsed with lxml and cached to ``.cache/importer/<source>.json``.
+Page renders only ever read the in-memory copy of that cache.
+"""
+
+import json
+import os
+import threading
+import time
+
+from portfolio.documents import ROOT
+from portfolio.lazy import lazy_import
+
+requests = lazy_import("requests")
+lxml_html = lazy_import("lxml.html")
+
+SOURCES_FILE = os.environ.get("PORTFOLIO_SOURCES_FILE", os.path.join(ROOT, "content", "sources.json"))
+CACHE_DIR = os.path.join(ROOT, ".cache", "importer")
+TIMEOUT = (3.05, 10)  # connect, read
+DEFAULT_TTL = 6 * 60 * 60
+RETRY_AFTER_ERROR = 5 * 60
+USER_AGENT = "portfolio-importer/1.0"
+
+
+def load_sources(path=SOURCES_FILE):
+    """Return ``{name: config}`` for every source with a URL."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            sources = json.load(f)
+    except FileNotFoundError:
+        return {}
+    return {name: config for name, config in sources.items() if config.get("url")}
+
+
+def parse_profile(text, url):
+    """Pull the OpenGraph/HTML title, description and canonical URL from a page."""
+    doc = lxml_html.fromstring(text)
+
+    def meta(prop):
+        values = doc.xpath(f"//meta[@property='{prop}' or @name='{prop}']/@content")
+        return values[0].strip() if values else ""
+
+    return {
+        "title": meta("og:title") or (doc.findtext(".//title") or "").strip(),
+        "description": meta("og:description") or meta("description"),
+        "url": meta("og:url") or url,
+    }
+
+
+def parse_publications(text, config):
+    """Extract one dict per element matching ``item_xpath``, fields by xpath."""
+    doc = lxml_html.fromstring(text)
+    items = []
+    for element in doc.xpath(config["item_xpath"]):
+        item = {field: " ".join(str(element.xpath(xpath)).split())
+                for field, xpath in config.get("fields", {}).items()}
+        if any(item.values()):
+            items.append(item)
+    return {"items": items, "count": len(items)}
+
+
+class Importer:
+    def __init__(self, sources=None, cache_dir=CACHE_DIR):
+        self._sources = sources
+        self._cache_dir = cache_dir
+        self._lock = threading.Lock()
+        self._cache = None  # name -> cache entry
+        self._session = None
+        self._thread = None
+        self._wake = threading.Event()
+
+    @property
+    def sources(self):
+        if self._sources is None:
+            self._sources = load_sources()
+        return self._sources
+
+    def _session_for_thread(self):
+        if self._session is None:
+            # One pooled, keep-alive session; only the refresh thread uses it
+            session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=4, max_retries=2)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            session.headers["User-Agent"] = USER_AGENT
+            self._session = session
+        return self._session
+
+    def _path(self, name):
+        return os.path.join(self._cache_dir, f"{name}.json")
+
+    def _load_cache(self):
+        if self._cache is None:
+            with self._lock:
+                if self._cache is None:
+                    cache = {}
+                    for name in self.sources:
+                        try:
+                            with open(self._path(name), encoding="utf-8") as f:
+                                cache[name] = json.load(f)
+                        except (OSError, ValueError):
+                            continue
+                    self._cache = cache
+        return self._cache
+
+    def _store(self, name, entry):
+        os.makedirs(self._cache_dir, exist_ok=True)
+        tmp_path = f"{self._path(name)}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(entry, f, ensure_ascii=False)
+        os.replace(tmp_path, self._path(name))
+        with self._lock:
+            # Copy-on-write so readers never see a half-updated dict
+            self._cache = {**self._cache, name: entry}
+
+    def get(self, name):
+        """Return the cached data for ``name`` (never blocks on the network)."""
+        entry = self._load_cache().get(name)
+        return entry["data"] if entry else None
+
+    def due(self, name, now=None):
+        entry = self._load_cache().get(name)
+        if entry is None:
+            return True
+        now = now or time.time()
+        ttl = self.sources[name].get("ttl", DEFAULT_TTL)
+        if entry.get("error"):
+            ttl = min(ttl, RETRY_AFTER_ERROR)
+        return now - entry["checked_at"] >= ttl
+
+    def refresh(self, name):
+        """Fetch one source (conditionally) and update its cache entry."""
+        config = self.sources[name]
+        previous = self._load_cache().get(name) or {}
+        headers = {}
+        if previous.get("data") is not None and previous.get("url") == config["url"]:
+            if previous.get("etag"):
+                headers["If-None-Match"] = previous["etag"]
+            if previous.get("last_modified"):
+                headers["If-Modified-Since"] = previous["last_modified"]
+
+        now = time.time()
+        try:
+            response = self._session_for_thread().get(config["url"], headers=headers, timeout=TIMEOUT)
+            if response.status_code == 304:
+                entry = {**previous, "checked_at": now, "error": None}
+            else:
+                response.raise_for_status()
+                if config.get("kind") == "publications":
+                    data = parse_publications(response.text, config)
+                else:
+                    data = parse_profile(response.text, config["url"])
+                entry = {
+                    "url": config["url"],
+                    "etag": response.headers.get("ETag"),
+                    "last_modified": response.headers.get("Last-Modified"),
+                    "fetched_at": now,
+                    "checked_at": now,
+                    "error": None,
+                    "data": data,
+                }
+        except Exception as exc:
+            # Keep serving the last good data; retry sooner than the TTL
+            entry = {**previous, "checked_at": now, "error": repr(exc)[:300]}
+            entry.setdefault("data", None)
+        self._store(name, entry)
+        return entry
+
+    def refresh_due(self):
+        for name in self.sources:
+            if self.due(name):
+                self.refresh(name)
+
+    def _run(self):
+        while True:
+            try:
+                self.refresh_due()
+            except Exception:
+                pass
+            self._wake.wait(60)
+            self._wake.clear()
+
+    def start(self):
+        """Start the refresh thread once; returns None when nothing is configured."""
+        if not self.sources:
+            return None
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="portfolio-importer", daemon=True)
+                self._thread.start()
+        return self._thread
+
+
+importer = Importer()
+
+
+def profile_url(name):
+    """Canonical URL of an imported profile, falling back to the configured one."""
+    data = importer.get(name)
+    if data and data.get("url"):
+        return data["url"]
+    config = importer.sources.get(name)
+    return config["url"] if config else None
+
+
+def publication_count():
+    data = importer.get("publications")
+    return data["count"] if data else None
+
+
+def warm():
+    """Start background refreshes; run from the startup warm-up thread."""
+    importer.start()
@@ -0,0 +1,112 @@
+"""Deferred imports for the heavy plotting/data libraries.
+
+``pandas`` and ``plotly`` dominate cold start but are only needed by a few
+pages. Pages import them through :func:`lazy_import`, which returns a proxy
+that performs the real import on first attribute access. After the first
+page has rendered, :func:`start_warmup` can preload them in a background
+thread so the first chart view does not pay for the import either.
+:func:`warmup_status` reports its progress for the readiness probe.
+"""
+
+import importlib
+import os
+import threading
+
+# Modules preloaded by the warm-up thread
+HEAVY_MODULES = ("pandas", "plotly.express", "plotly.graph_objects")
+
+# "module:function" callables run by the warm-up thread after the imports
+WARMUP_TASKS = (
+    "portfolio.documents:warm",
+    "portfolio.previews:warm",
+    "portfolio.images:warm",
+    "portfolio.outbox:warm",
+    "portfolio.search:warm",
+    "portfolio.importer:warm",
+    "portfolio.experience:warm",
+    "portfolio.charts:warm",
+    "sections:warm",
+)
+
+_warmup_lock = threading.Lock()
+_warmup_thread = None
+_warmup_done = threading.Event()
+_warmup_failed = []  # module names and task specs that raised
+
+
+class LazyModule:
+    """Stand-in for a module that is imported on first attribute access."""
+
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+
+    def _load(self):
+        if self._module is None:
+            # import_module holds the import lock, so concurrent sessions
+            # touching the proxy at once still import exactly once
+            self._module = importlib.import_module(self._name)
+        return self._module
+
+    @property
+    def loaded(self):
+        return self._module is not None
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+    def __repr__(self):
+        state = "loaded" if self.loaded else "not loaded"
+        return f"<LazyModule {self._name!r} ({state})>"
+
+
+def lazy_import(name):
+    return LazyModule(name)
+
+
+def warmup_enabled():
+    return os.environ.get("PORTFOLIO_WARMUP", "1").lower() not in ("0", "false", "no")
+
+
+def _preload(modules, tasks):
+    for name in modules:
+        try:
+            importlib.import_module(name)
+        except ImportError:
+            # A missing optional dependency only matters when the page
+            # that needs it is opened
+            _warmup_failed.append(name)
+    for spec in tasks:
+        module_name, func_name = spec.split(":")
+        try:
+            getattr(importlib.import_module(module_name), func_name)()
+        except Exception:
+            # Warm-up is best effort; the page retries on first use
+            _warmup_failed.append(spec)
+    _warmup_done.set()
+
+
+def start_warmup(modules=HEAVY_MODULES, tasks=WARMUP_TASKS):
+    """Preload ``modules`` and run ``tasks`` in a daemon thread, at most once per process.
+
+    Returns the thread, or None when warm-up is disabled with
+    ``PORTFOLIO_WARMUP=0``.
+    """
+    global _warmup_thread
+    if not warmup_enabled():
+        return None
+    with _warmup_lock:
+        if _warmup_thread is None:
+            _warmup_thread = threading.Thread(
+                target=_preload, args=(tuple(modules), tuple(tasks)),
+                name="portfolio-warmup", daemon=True,
+            )
+            _warmup_thread.start()
+    return _warmup_thread
+
+
+def warmup_status():
+    """Return ``(finished, failed)``; finished is True when warm-up is disabled."""
+    if not warmup_enabled():
+        return True, []
+    return _warmup_done.is_set(), list(_warmup_failed)
@@ -0,0 +1,43 @@
+"""Lite render mode for low-end phones and slow connections.
+
+Lite mode swaps the animated theme for ``assets/lite.css`` (no keyframes,
+gradients, shadows or web fonts), skips ``st.balloons()``, shows a smaller
+profile photo and draws charts as static images instead of Plotly. A new
+session starts in lite mode when the URL has ``?lite=1`` or the browser
+sends ``Save-Data: on``, a slow ``ECT`` client hint or
+``Sec-CH-Prefers-Reduced-Motion: reduce``. Visitors can switch it in the
+sidebar.
+"""
+
+import streamlit as st
+
+QUERY_PARAM = "lite"
+# Effective connection types (the ECT client hint) treated as slow
+SLOW_CONNECTIONS = ("slow-2g", "2g")
+OFF_VALUES = ("0", "false", "off", "no")
+
+
+def _header(name):
+    return (st.context.headers.get(name) or "").strip().lower()
+
+
+def requested():
+    """Whether the current request asks for lite mode."""
+    value = st.query_params.get(QUERY_PARAM)
+    if value is not None:
+        return value.strip().lower() not in OFF_VALUES
+    return (
+        _header("Save-Data") == "on"
+        or _header("ECT") in SLOW_CONNECTIONS
+        or _header("Sec-CH-Prefers-Reduced-Motion") == "reduce"
+    )
+
+
+def enabled():
+    return st.session_state.visitor.lite
+
+
+def celebrate():
+    """``st.balloons()``, except in lite mode."""
+    if not enabled():
+        st.balloons()
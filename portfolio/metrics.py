@@ -0,0 +1,243 @@
+"""Low-overhead render timing for the page chrome and each section.
+
+``track(name)`` wraps a block of rendering code and records its wall time
+and the bytes of ForwardMsg deltas it sent into fixed-bucket histograms,
+plus a rerun counter. Recording is a perf_counter pair, a bisect and a
+short lock, so it stays on in production. Metrics are per process and
+exported in Prometheus text format, to a file (``PORTFOLIO_METRICS_FILE``,
+for the node_exporter textfile collector) and/or over HTTP
+(``PORTFOLIO_METRICS_PORT``), which also answers the ``/healthz`` and
+``/readyz`` probes.
+"""
+
+import bisect
+import contextlib
+import json
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+TIME_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+BYTE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+EXPORT_INTERVAL = 15  # seconds
+
+
+class Histogram:
+    """Prometheus-style histogram with fixed upper bounds."""
+
+    __slots__ = ("bounds", "counts", "total", "count", "_lock")
+
+    def __init__(self, bounds):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)  # last slot is +Inf
+        self.total = 0.0
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def observe(self, value):
+        index = bisect.bisect_left(self.bounds, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.total += value
+            self.count += 1
+
+    def quantile(self, q):
+        """Estimate the ``q`` quantile by interpolating inside its bucket."""
+        with self._lock:
+            counts, count = list(self.counts), self.count
+        if not count:
+            return 0.0
+        rank = q * count
+        seen = 0
+        for index, bucket_count in enumerate(counts):
+            if seen + bucket_count >= rank and bucket_count:
+                lower = self.bounds[index - 1] if index else 0.0
+                upper = self.bounds[index] if index < len(self.bounds) else self.bounds[-1]
+                return lower + (upper - lower) * (rank - seen) / bucket_count
+            seen += bucket_count
+        return self.bounds[-1]
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else 0.0
+
+
+class SectionStats:
+    __slots__ = ("seconds", "payload_bytes")
+
+    def __init__(self):
+        self.seconds = Histogram(TIME_BUCKETS)
+        self.payload_bytes = Histogram(BYTE_BUCKETS)
+
+    @property
+    def reruns(self):
+        return self.seconds.count
+
+
+_lock = threading.Lock()
+_stats = {}  # name -> SectionStats
+
+
+def stats(name):
+    entry = _stats.get(name)
+    if entry is None:
+        with _lock:
+            entry = _stats.setdefault(name, SectionStats())
+    return entry
+
+
+try:
+    from streamlit.runtime.scriptrunner import get_script_run_ctx as _script_context
+except ImportError:
+    def _script_context():
+        return None
+
+
+@contextlib.contextmanager
+def track(name):
+    """Record wall time and delta bytes of the enclosed rendering code."""
+    ctx = _script_context()
+    sent = [0]
+    original = getattr(ctx, "_enqueue", None)
+    if original is not None:
+        def counting_enqueue(msg):
+            sent[0] += msg.ByteSize()
+            original(msg)
+        ctx._enqueue = counting_enqueue
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        if original is not None:
+            ctx._enqueue = original
+        entry = stats(name)
+        entry.seconds.observe(elapsed)
+        if original is not None:
+            entry.payload_bytes.observe(sent[0])
+
+
+def summary():
+    """Return one dict per tracked name, slowest p95 first."""
+    with _lock:
+        items = list(_stats.items())
+    rows = [
+        {
+            "name": name,
+            "reruns": entry.reruns,
+            "mean_ms": entry.seconds.mean * 1000,
+            "p50_ms": entry.seconds.quantile(0.5) * 1000,
+            "p95_ms": entry.seconds.quantile(0.95) * 1000,
+            "mean_bytes": entry.payload_bytes.mean,
+        }
+        for name, entry in items
+    ]
+    return sorted(rows, key=lambda row: row["p95_ms"], reverse=True)
+
+
+def _label(value):
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _histogram_lines(metric, name, histogram):
+    with histogram._lock:
+        counts, total, count = list(histogram.counts), histogram.total, histogram.count
+    label = _label(name)
+    lines = []
+    cumulative = 0
+    for bound, bucket_count in zip(histogram.bounds, counts):
+        cumulative += bucket_count
+        lines.append(f'{metric}_bucket{{section="{label}",le="{bound}"}} {cumulative}')
+    lines.append(f'{metric}_bucket{{section="{label}",le="+Inf"}} {count}')
+    lines.append(f'{metric}_sum{{section="{label}"}} {total}')
+    lines.append(f'{metric}_count{{section="{label}"}} {count}')
+    return lines
+
+
+def render_prometheus():
+    """Return all metrics in Prometheus text exposition format."""
+    with _lock:
+        items = sorted(_stats.items())
+    lines = [
+        "# HELP portfolio_render_seconds Wall time spent rendering a section.",
+        "# TYPE portfolio_render_seconds histogram",
+    ]
+    for name, entry in items:
+        lines += _histogram_lines("portfolio_render_seconds", name, entry.seconds)
+    lines += [
+        "# HELP portfolio_render_payload_bytes Delta bytes sent while rendering a section.",
+        "# TYPE portfolio_render_payload_bytes histogram",
+    ]
+    for name, entry in items:
+        lines += _histogram_lines("portfolio_render_payload_bytes", name, entry.payload_bytes)
+    lines += [
+        "# HELP portfolio_reruns_total Reruns that rendered a section.",
+        "# TYPE portfolio_reruns_total counter",
+    ]
+    for name, entry in items:
+        lines.append(f'portfolio_reruns_total{{section="{_label(name)}"}} {entry.reruns}')
+    return "\n".join(lines) + "\n"
+
+
+def write_prometheus_file(path):
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(render_prometheus())
+    os.replace(tmp_path, path)
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        path = self.path.split("?")[0]
+        if path == "/metrics":
+            self._send(200, render_prometheus(), "text/plain; version=0.0.4; charset=utf-8")
+        elif path == "/healthz":
+            self._send(200, "ok\n", "text/plain; charset=utf-8")
+        elif path == "/readyz":
+            from portfolio.health import readiness
+
+            status = readiness()
+            self._send(200 if status["ready"] else 503, json.dumps(status) + "\n", "application/json")
+        else:
+            self.send_error(404)
+
+    def _send(self, code, text, content_type):
+        body = text.encode("utf-8")
+        self.send_response(code)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+_exporter_started = False
+
+
+def start_exporters():
+    """Start the file/HTTP exporters configured by environment, once per process."""
+    global _exporter_started
+    with _lock:
+        if _exporter_started:
+            return
+        _exporter_started = True
+
+    port = os.environ.get("PORTFOLIO_METRICS_PORT")
+    if port:
+        server = ThreadingHTTPServer(("127.0.0.1", int(port)), _MetricsHandler)
+        threading.Thread(target=server.serve_forever, name="portfolio-metrics-http", daemon=True).start()
+
+    path = os.environ.get("PORTFOLIO_METRICS_FILE")
+    if path:
+        def export_loop():
+            while True:
+                time.sleep(EXPORT_INTERVAL)
+                try:
+                    write_prometheus_file(path)
+                except OSError:
+                    pass
+        threading.Thread(target=export_loop, name="portfolio-metrics-file", daemon=True).start()
@@ -0,0 +1,366 @@
+"""Durable outbox for contact-form messages.
+
+``submit`` validates a message, applies spam limits and appends it to a
+SQLite table; that is all a rerun waits for. A daemon worker thread claims
+pending messages in batches and hands them to a sink (local file, webhook
+or SMTP), retrying failures with exponential backoff. Claims are leased,
+so several server processes can share one database file safely. The
+per-IP limit is kept in the same database, so it holds across replicas.
+"""
+
+import contextlib
+import hashlib
+import json
+import os
+import re
+import smtplib
+import threading
+import time
+import urllib.request
+from collections import defaultdict, deque
+from email.message import EmailMessage
+
+from portfolio.db import DATA_DIR, connect
+
+BATCH_SIZE = 20
+MAX_ATTEMPTS = 6
+BACKOFF_BASE = 5  # seconds, doubled per attempt
+BACKOFF_MAX = 15 * 60
+POLL_INTERVAL = 30
+LEASE_SECONDS = 120
+
+# Spam limits: (max submissions, window in seconds)
+SESSION_LIMIT = (3, 10 * 60)
+IP_LIMIT = (10, 60 * 60)
+DUPLICATE_WINDOW = 24 * 60 * 60
+
+MAX_LENGTHS = {"name": 100, "email": 254, "company": 150, "phone": 40, "reason": 80, "message": 5000}
+EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS outbox (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    created REAL NOT NULL,
+    digest TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt REAL NOT NULL,
+    lease_until REAL,
+    last_error TEXT
+);
+CREATE INDEX IF NOT EXISTS outbox_due ON outbox (status, next_attempt);
+CREATE INDEX IF NOT EXISTS outbox_digest ON outbox (digest, created);
+CREATE TABLE IF NOT EXISTS rate_hits (
+    scope TEXT NOT NULL,
+    key TEXT NOT NULL,
+    at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS rate_hits_key ON rate_hits (scope, key, at);
+"""
+
+
+class OutboxError(Exception):
+    """Base class for reasons a message was not queued."""
+
+
+class ValidationError(OutboxError):
+    pass
+
+
+class RateLimited(OutboxError):
+    pass
+
+
+class Duplicate(OutboxError):
+    pass
+
+
+def validate(fields):
+    """Return a cleaned copy of the contact-form ``fields`` or raise ValidationError."""
+    cleaned = {key: str(fields.get(key) or "").strip() for key in MAX_LENGTHS}
+    missing = [key for key in ("name", "email", "message") if not cleaned[key]]
+    if missing:
+        raise ValidationError("Please fill in all required fields (Name, Email, Message)")
+    if not EMAIL_RE.match(cleaned["email"]):
+        raise ValidationError("Please enter a valid email address")
+    for key, limit in MAX_LENGTHS.items():
+        if len(cleaned[key]) > limit:
+            raise ValidationError(f"{key.capitalize()} must be at most {limit} characters")
+    return cleaned
+
+
+class FileSink:
+    """Appends delivered messages to a JSON-lines file (local runs and tests)."""
+
+    def __init__(self, path=os.path.join(DATA_DIR, "outbox.jsonl")):
+        self.path = path
+
+    def deliver(self, messages):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as f:
+            for message in messages:
+                f.write(json.dumps(message, ensure_ascii=False) + "\n")
+
+
+class WebhookSink:
+    """POSTs each batch as a JSON array."""
+
+    def __init__(self, url, timeout=10):
+        self.url = url
+        self.timeout = timeout
+
+    def deliver(self, messages):
+        request = urllib.request.Request(
+            self.url, data=json.dumps(messages).encode("utf-8"),
+            headers={"Content-Type": "application/json"}, method="POST",
+        )
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            response.read()
+
+
+class SmtpSink:
+    """Sends one email per message over a single SMTP connection per batch."""
+
+    def __init__(self, host, port, to_addr, user=None, password=None, timeout=20):
+        self.host = host
+        self.port = port
+        self.to_addr = to_addr
+        self.user = user
+        self.password = password
+        self.timeout = timeout
+
+    def deliver(self, messages):
+        with smtplib.SMTP(self.host, self.port, timeout=self.timeout) as smtp:
+            if self.user:
+                smtp.starttls()
+                smtp.login(self.user, self.password)
+            for message in messages:
+                email = EmailMessage()
+                email["From"] = self.user or self.to_addr
+                email["To"] = self.to_addr
+                email["Reply-To"] = message["email"]
+                email["Subject"] = f"Portfolio contact: {message['reason'] or 'message'} from {message['name']}"
+                email.set_content("\n".join(f"{k}: {v}" for k, v in message.items() if k != "message")
+                                  + "\n\n" + message["message"])
+                smtp.send_message(email)
+
+
+def sink_from_env():
+    """Build the sink named by ``PORTFOLIO_OUTBOX_SINK`` (file, webhook or smtp)."""
+    kind = os.environ.get("PORTFOLIO_OUTBOX_SINK", "file")
+    if kind == "webhook":
+        return WebhookSink(os.environ["PORTFOLIO_WEBHOOK_URL"])
+    if kind == "smtp":
+        return SmtpSink(
+            os.environ["PORTFOLIO_SMTP_HOST"],
+            int(os.environ.get("PORTFOLIO_SMTP_PORT", "587")),
+            os.environ["PORTFOLIO_SMTP_TO"],
+            os.environ.get("PORTFOLIO_SMTP_USER"),
+            os.environ.get("PORTFOLIO_SMTP_PASSWORD"),
+        )
+    return FileSink(os.environ.get("PORTFOLIO_OUTBOX_FILE", FileSink().path))
+
+
+class RateLimiter:
+    """Sliding-window limit per key, kept in process memory."""
+
+    def __init__(self, limit, window):
+        self.limit = limit
+        self.window = window
+        self._hits = defaultdict(deque)
+        self._lock = threading.Lock()
+
+    def allow(self, key, now=None):
+        if key is None:
+            return True
+        now = now or time.time()
+        with self._lock:
+            hits = self._hits[key]
+            while hits and hits[0] <= now - self.window:
+                hits.popleft()
+            if len(hits) >= self.limit:
+                return False
+            hits.append(now)
+            return True
+
+
+class SharedRateLimiter:
+    """Sliding-window limit per key, kept in SQLite for all server processes."""
+
+    def __init__(self, limit, window, scope, conn):
+        self.limit = limit
+        self.window = window
+        self.scope = scope
+        self._conn = conn
+
+    def allow(self, key, now=None, conn=None):
+        """Record a hit for ``key`` if it is under the limit.
+
+        Pass ``conn`` to count the hit inside the caller's open write
+        transaction; otherwise the check runs in a transaction of its own.
+        """
+        if key is None:
+            return True
+        now = now or time.time()
+        if conn is not None:
+            return self._allow(conn, key, now)
+        with self._conn() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            allowed = self._allow(conn, key, now)
+            conn.execute("COMMIT")
+        return allowed
+
+    def _allow(self, conn, key, now):
+        conn.execute("DELETE FROM rate_hits WHERE scope = ? AND key = ? AND at <= ?",
+                     (self.scope, key, now - self.window))
+        (hits,) = conn.execute("SELECT COUNT(*) FROM rate_hits WHERE scope = ? AND key = ?",
+                               (self.scope, key)).fetchone()
+        if hits >= self.limit:
+            return False
+        conn.execute("INSERT INTO rate_hits (scope, key, at) VALUES (?, ?, ?)", (self.scope, key, now))
+        return True
+
+
+class Outbox:
+    def __init__(self, db_path=None, sink=None):
+        self._db_path = db_path
+        self._sink = sink
+        # A session stays on one replica; an IP can reach any of them
+        self._session_limiter = RateLimiter(*SESSION_LIMIT)
+        self._ip_limiter = SharedRateLimiter(*IP_LIMIT, scope="ip", conn=self._conn)
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._worker = None
+        self._worker_lock = threading.Lock()
+        self._schema_ready = False
+
+    @contextlib.contextmanager
+    def _conn(self):
+        with connect(self._db_path) as conn:
+            if not self._schema_ready:
+                conn.executescript(SCHEMA)
+                self._schema_ready = True
+            yield conn
+
+    @property
+    def sink(self):
+        if self._sink is None:
+            self._sink = sink_from_env()
+        return self._sink
+
+    def submit(self, fields, session_id=None, client_ip=None):
+        """Validate and queue a message; return its outbox id."""
+        message = validate(fields)
+        digest = hashlib.sha256(
+            f"{message['email'].lower()}\0{message['message']}".encode("utf-8")
+        ).hexdigest()
+        now = time.time()
+
+        # One write transaction, so two replicas (or two clicks) submitting
+        # the same message cannot both pass the duplicate check
+        with self._conn() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            duplicate = conn.execute(
+                "SELECT 1 FROM outbox WHERE digest = ? AND created > ? LIMIT 1",
+                (digest, now - DUPLICATE_WINDOW),
+            ).fetchone()
+            if duplicate:
+                raise Duplicate("This message has already been sent")
+            if (not self._session_limiter.allow(session_id, now)
+                    or not self._ip_limiter.allow(client_ip, now, conn=conn)):
+                raise RateLimited("Too many messages, please try again later")
+            cursor = conn.execute(
+                "INSERT INTO outbox (created, digest, payload, next_attempt) VALUES (?, ?, ?, ?)",
+                (now, digest, json.dumps({**message, "sent_at": now}), now),
+            )
+            conn.execute("COMMIT")
+        self.start_worker()
+        self._wake.set()
+        return cursor.lastrowid
+
+    def _claim(self):
+        now = time.time()
+        with self._conn() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            rows = conn.execute(
+                "SELECT id, payload, attempts FROM outbox"
+                " WHERE (status = 'pending' AND next_attempt <= ?)"
+                " OR (status = 'sending' AND lease_until < ?)"
+                " ORDER BY id LIMIT ?",
+                (now, now, BATCH_SIZE),
+            ).fetchall()
+            conn.executemany(
+                "UPDATE outbox SET status = 'sending', lease_until = ? WHERE id = ?",
+                [(now + LEASE_SECONDS, row["id"]) for row in rows],
+            )
+            conn.execute("COMMIT")
+        return rows
+
+    def deliver_once(self):
+        """Deliver one batch of due messages; return how many were sent."""
+        rows = self._claim()
+        if not rows:
+            return 0
+        try:
+            self.sink.deliver([json.loads(row["payload"]) for row in rows])
+        except Exception as exc:
+            now = time.time()
+            updates = []
+            for row in rows:
+                attempts = row["attempts"] + 1
+                status = "failed" if attempts >= MAX_ATTEMPTS else "pending"
+                delay = min(BACKOFF_BASE * 2 ** (attempts - 1), BACKOFF_MAX)
+                updates.append((status, attempts, now + delay, repr(exc)[:500], row["id"]))
+            with self._conn() as conn:
+                conn.executemany(
+                    "UPDATE outbox SET status = ?, attempts = ?, next_attempt = ?,"
+                    " lease_until = NULL, last_error = ? WHERE id = ?",
+                    updates,
+                )
+            return 0
+        with self._conn() as conn:
+            conn.executemany(
+                "UPDATE outbox SET status = 'sent', lease_until = NULL WHERE id = ?",
+                [(row["id"],) for row in rows],
+            )
+        return len(rows)
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                sent = self.deliver_once()
+            except Exception:
+                sent = 0
+            if sent < BATCH_SIZE:
+                # Nothing left (or only failures): sleep until a submit wakes us
+                self._wake.wait(POLL_INTERVAL)
+                self._wake.clear()
+
+    def start_worker(self):
+        with self._worker_lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._stop.clear()
+                self._worker = threading.Thread(target=self._run, name="portfolio-outbox", daemon=True)
+                self._worker.start()
+        return self._worker
+
+    def stop_worker(self, timeout=5):
+        self._stop.set()
+        self._wake.set()
+        if self._worker is not None:
+            self._worker.join(timeout)
+
+    def counts(self):
+        """Return ``{status: count}`` for the outbox table."""
+        with self._conn() as conn:
+            rows = conn.execute("SELECT status, COUNT(*) AS n FROM outbox GROUP BY status").fetchall()
+        return {row["status"]: row["n"] for row in rows}
+
+
+outbox = Outbox()
+
+
+def warm():
+    """Start the delivery worker so messages left from a restart go out."""
+    outbox.start_worker()
@@ -0,0 +1,178 @@
+"""First-page thumbnails and low-resolution page previews for the PDFs.
+
+Pillow cannot rasterize PDFs, so pages are rendered with ``pypdfium2``
+(or the ``pdftoppm`` command from poppler when that is all there is) and
+then resized and encoded with Pillow. Rendering runs in a background
+process pool, never in a rerun, and the images are written to
+``.cache/previews/<sha256>/`` so each document is rendered once per
+content version, across restarts and processes.
+"""
+
+import multiprocessing
+import os
+import shutil
+import subprocess
+import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+from portfolio.documents import ROOT, document_store
+
+CACHE_DIR = os.path.join(ROOT, ".cache", "previews")
+THUMB_WIDTH = 320
+PREVIEW_WIDTH = 800
+PREVIEW_PAGES = 3
+MAX_WORKERS = 2
+
+
+def _image_format():
+    from PIL import features
+
+    return ("WEBP", "webp") if features.check("webp") else ("PNG", "png")
+
+
+def _render_pages_pdfium(path, width, pages):
+    import pypdfium2 as pdfium
+
+    pdf = pdfium.PdfDocument(path)
+    try:
+        images = []
+        for index in range(min(pages, len(pdf))):
+            page = pdf[index]
+            images.append(page.render(scale=width / page.get_width()).to_pil())
+            page.close()
+        return images
+    finally:
+        pdf.close()
+
+
+def _render_pages_poppler(path, width, pages):
+    from PIL import Image
+
+    if shutil.which("pdftoppm") is None:
+        raise RuntimeError("no PDF renderer available (install pypdfium2 or poppler)")
+    images = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for number in range(1, pages + 1):
+            prefix = os.path.join(tmp, f"page-{number}")
+            result = subprocess.run(
+                ["pdftoppm", "-png", "-singlefile", "-f", str(number), "-l", str(number),
+                 "-scale-to-x", str(width), "-scale-to-y", "-1", path, prefix],
+                capture_output=True,
+            )
+            if result.returncode != 0:
+                # Past the last page
+                break
+            with Image.open(f"{prefix}.png") as image:
+                images.append(image.copy())
+    return images
+
+
+def render_previews(path, out_dir, pages=PREVIEW_PAGES):
+    """Render a thumbnail and up to ``pages`` previews of ``path`` into ``out_dir``.
+
+    Runs in a worker process. Files are written to a temporary directory
+    that is renamed into place, so a directory that exists is complete.
+    """
+    try:
+        images = _render_pages_pdfium(path, PREVIEW_WIDTH, pages)
+    except ImportError:
+        images = _render_pages_poppler(path, PREVIEW_WIDTH, pages)
+
+    image_format, ext = _image_format()
+    parent = os.path.dirname(out_dir)
+    os.makedirs(parent, exist_ok=True)
+    tmp_dir = tempfile.mkdtemp(dir=parent)
+    try:
+        for number, image in enumerate(images, start=1):
+            image = image.convert("RGB")
+            image.save(os.path.join(tmp_dir, f"page-{number}.{ext}"), image_format, quality=70, method=4)
+            if number == 1:
+                thumb_height = round(image.height * THUMB_WIDTH / image.width)
+                thumb = image.resize((THUMB_WIDTH, thumb_height))
+                thumb.save(os.path.join(tmp_dir, f"thumb.{ext}"), image_format, quality=75, method=4)
+        os.replace(tmp_dir, out_dir)
+    except OSError:
+        # Another worker finished the same document first
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        if not os.path.isdir(out_dir):
+            raise
+    return out_dir
+
+
+class PreviewSet:
+    def __init__(self, directory):
+        files = sorted(os.listdir(directory))
+        self.thumbnail = next((os.path.join(directory, f) for f in files if f.startswith("thumb.")), None)
+        self.pages = [os.path.join(directory, f) for f in files if f.startswith("page-")]
+        self.pages.sort(key=lambda p: int(os.path.basename(p).split("-")[1].split(".")[0]))
+
+
+class PreviewService:
+    """Hands out cached previews and schedules rendering for missing ones."""
+
+    def __init__(self, cache_dir=CACHE_DIR, max_workers=MAX_WORKERS):
+        self._cache_dir = cache_dir
+        self._max_workers = max_workers
+        self._lock = threading.Lock()
+        self._executor = None
+        self._pending = {}  # cache key -> Future
+
+    def _pool(self):
+        if self._executor is None:
+            # spawn, not fork: forking the multi-threaded server is unsafe
+            self._executor = ProcessPoolExecutor(
+                max_workers=self._max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._executor
+
+    def _directory(self, name):
+        """Return ``(info, cache directory)``, or ``(None, None)`` if the document is gone."""
+        info = document_store.info(name)
+        if info is None:
+            return None, None
+        return info, os.path.join(self._cache_dir, info.sha256[:16])
+
+    def get(self, name):
+        """Return the PreviewSet for ``name``, or None while it is being rendered."""
+        info, directory = self._directory(name)
+        if info is None:
+            return None
+        if os.path.isdir(directory):
+            return PreviewSet(directory)
+        self.schedule(name)
+        return None
+
+    def schedule(self, name):
+        info, directory = self._directory(name)
+        if info is None or os.path.isdir(directory):
+            return None
+        with self._lock:
+            future = self._pending.get(directory)
+            # A failed render is not retried until the document changes
+            if future is None:
+                future = self._pool().submit(render_previews, info.path, directory)
+                self._pending[directory] = future
+        return future
+
+    def failed(self, name):
+        """Return the rendering error for ``name``, if its last attempt failed."""
+        _, directory = self._directory(name)
+        future = self._pending.get(directory) if directory else None
+        if future is not None and future.done():
+            return future.exception()
+        return None
+
+
+preview_service = PreviewService()
+
+
+def pdf_documents():
+    return [name for name, info in document_store.manifest().items() if info.mime == "application/pdf"]
+
+
+def warm():
+    """Queue previews for every PDF; run from the startup warm-up thread."""
+    for name in pdf_documents():
+        preview_service.schedule(name)
@@ -0,0 +1,196 @@
+"""Local TCP reverse proxy in front of several Streamlit replicas.
+
+Streamlit keeps a session on the websocket it was opened on, and serves
+``st.image`` / download bytes from the replica's own in-memory media store,
+so a browser must keep talking to one replica. The proxy therefore works
+at the TCP level (websockets pass through untouched) and picks the replica
+by a hash of the client IP. Each replica's ``/readyz`` probe is polled
+every ``check_interval`` seconds; only ready replicas get new connections,
+so a cold or restarting replica never takes live traffic.
+
+Replicas would otherwise see every visitor as 127.0.0.1, so the proxy
+parses each HTTP request head on the way in and appends the client
+address to ``X-Forwarded-For``; bodies and upgraded websockets are relayed
+as is. Replicas read the right-most hop (``PORTFOLIO_TRUSTED_PROXIES``).
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import urllib.error
+import urllib.request
+
+logger = logging.getLogger(__name__)
+
+UNAVAILABLE = (
+    b"HTTP/1.1 503 Service Unavailable\r\nContent-Type: text/plain\r\n"
+    b"Retry-After: 2\r\nConnection: close\r\nContent-Length: 26\r\n\r\n"
+    b"No replica is ready yet.\r\n"
+)
+BUFFER_SIZE = 64 * 1024
+FORWARDED_FOR = b"x-forwarded-for"
+
+
+def forward_head(head, client_ip):
+    """Rewrite one request head for the upstream.
+
+    Returns ``(head, body_length, raw)``: the head with ``client_ip``
+    appended to X-Forwarded-For, the Content-Length of the body, and
+    whether the rest of the connection must be relayed unparsed (websocket
+    upgrades and chunked bodies; the latter get ``Connection: close`` so
+    the replica reads no further requests from the connection).
+    """
+    request_line, *lines = head[:-4].split(b"\r\n")
+    headers = []  # (lowercase name, value, original line)
+    forwarded = []
+    for line in lines:
+        name, _, value = line.partition(b":")
+        name, value = name.strip().lower(), value.strip()
+        if name == FORWARDED_FOR:
+            forwarded.append(value)
+        else:
+            headers.append((name, value, line))
+    fields = {name: value for name, value, _ in headers}
+    chunked = b"chunked" in fields.get(b"transfer-encoding", b"").lower()
+    if chunked:
+        headers = [h for h in headers if h[0] != b"connection"]
+        headers.append((b"connection", b"close", b"Connection: close"))
+    forwarded.append(client_ip.encode("ascii"))
+    out = [request_line, *(line for _, _, line in headers), b"X-Forwarded-For: " + b", ".join(forwarded)]
+    raw = chunked or b"upgrade" in fields
+    return b"\r\n".join(out) + b"\r\n\r\n", int(fields.get(b"content-length", 0)), raw
+
+
+class Backend:
+    __slots__ = ("host", "port", "health_port", "ready", "status")
+
+    def __init__(self, host, port, health_port):
+        self.host = host
+        self.port = port
+        self.health_port = health_port
+        self.ready = False
+        self.status = {}
+
+    def __repr__(self):
+        return f"<Backend {self.host}:{self.port} {'ready' if self.ready else 'not ready'}>"
+
+    def check(self, timeout=1.0):
+        """Poll ``/readyz`` (blocking); return whether the replica is ready."""
+        url = f"http://{self.host}:{self.health_port}/readyz"
+        try:
+            with urllib.request.urlopen(url, timeout=timeout) as response:
+                self.status = json.loads(response.read())
+        except urllib.error.HTTPError as exc:
+            # 503 while warming up still carries the status body
+            try:
+                self.status = json.loads(exc.read())
+            except ValueError:
+                self.status = {}
+        except (OSError, ValueError):
+            self.status = {}
+        return bool(self.status.get("ready"))
+
+
+class ReplicaProxy:
+    def __init__(self, backends, check_interval=1.0):
+        self.backends = list(backends)
+        self.check_interval = check_interval
+
+    def pick(self, client_ip):
+        """Return the ready backend for ``client_ip``, or None.
+
+        Rendezvous hashing over every backend, ready or not: each client
+        ranks all backends the same way every time and takes the first
+        ready one, so a replica going down only moves its own clients
+        (spread over the rest) and they move back when it is ready again.
+        """
+        def score(backend):
+            # CRC32 is linear, so it would rank backends alike for every
+            # client and pile a failed replica's clients onto one neighbour
+            key = f"{client_ip}|{backend.host}:{backend.port}".encode("utf-8")
+            return hashlib.blake2b(key, digest_size=8).digest()
+
+        ranked = sorted(self.backends, key=score, reverse=True)
+        return next((backend for backend in ranked if backend.ready), None)
+
+    async def check_loop(self):
+        while True:
+            results = await asyncio.gather(*(asyncio.to_thread(b.check) for b in self.backends))
+            for backend, ready in zip(self.backends, results):
+                if ready != backend.ready:
+                    logger.info("%r is now %s", backend, "ready" if ready else "not ready")
+                backend.ready = ready
+            await asyncio.sleep(self.check_interval)
+
+    async def _pipe(self, reader, writer):
+        try:
+            while True:
+                data = await reader.read(BUFFER_SIZE)
+                if not data:
+                    break
+                writer.write(data)
+                await writer.drain()
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+        finally:
+            try:
+                writer.close()
+            except RuntimeError:
+                pass
+
+    async def _forward_requests(self, reader, writer, client_ip):
+        """Relay client -> replica, tagging every request with ``client_ip``."""
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                head, body_length, raw = forward_head(head, client_ip)
+                writer.write(head)
+                if raw:
+                    break
+                while body_length > 0:
+                    data = await reader.read(min(body_length, BUFFER_SIZE))
+                    if not data:
+                        raise asyncio.IncompleteReadError(b"", body_length)
+                    writer.write(data)
+                    body_length -= len(data)
+                await writer.drain()
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ValueError, ConnectionError,
+                asyncio.CancelledError):
+            # Client went away, or sent something that is not HTTP/1.1
+            try:
+                writer.close()
+            except RuntimeError:
+                pass
+            return
+        await self._pipe(reader, writer)
+
+    async def handle(self, client_reader, client_writer):
+        peer = client_writer.get_extra_info("peername") or ("", 0)
+        backend = self.pick(peer[0])
+        upstream = None
+        if backend is not None:
+            try:
+                upstream = await asyncio.open_connection(backend.host, backend.port)
+            except OSError:
+                # Went away since the last probe; stop routing to it
+                backend.ready = False
+        if upstream is None:
+            client_writer.write(UNAVAILABLE)
+            await client_writer.drain()
+            client_writer.close()
+            return
+        upstream_reader, upstream_writer = upstream
+        await asyncio.gather(
+            self._forward_requests(client_reader, upstream_writer, peer[0]),
+            self._pipe(upstream_reader, client_writer),
+        )
+
+    async def serve(self, host, port):
+        server = await asyncio.start_server(self.handle, host, port)
+        checker = asyncio.create_task(self.check_loop())
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            checker.cancel()
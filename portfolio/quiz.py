@@ -0,0 +1,159 @@
+"""Quiz question bank with O(1) random access and batched answer statistics.
+
+Questions live one JSON object per line in ``content/quiz.jsonl``. A
+binary index of line offsets is built once per file version and stored
+in ``.cache/quiz/``; a question is read with a single ``pread`` of its
+line, so a bank of tens of thousands of questions is never loaded whole.
+Per-question attempt/correct counts go through a CounterService and are
+flushed to SQLite in batches.
+"""
+
+import array
+import functools
+import json
+import os
+import random
+import threading
+
+from portfolio.counters import CounterService
+from portfolio.documents import ROOT
+
+BANK_PATH = os.path.join(ROOT, "content", "quiz.jsonl")
+INDEX_DIR = os.path.join(ROOT, ".cache", "quiz")
+QUESTIONS_PER_QUIZ = 3
+
+# Aggregate answer statistics, keyed "<question id>:attempts" / ":correct"
+quiz_stats = CounterService(table="quiz_stats")
+
+
+def _index_path(path, stat):
+    name = os.path.basename(path)
+    return os.path.join(INDEX_DIR, f"{name}.{stat.st_size}.{stat.st_mtime_ns}.idx")
+
+
+def build_index(path):
+    """Return an ``array('Q')`` of line start offsets plus the end offset."""
+    offsets = array.array("Q")
+    position = 0
+    with open(path, "rb") as f:
+        for line in f:
+            if line.strip():
+                offsets.append(position)
+            position += len(line)
+    offsets.append(position)
+    return offsets
+
+
+def load_index(path, stat):
+    index_path = _index_path(path, stat)
+    offsets = array.array("Q")
+    try:
+        with open(index_path, "rb") as f:
+            offsets.frombytes(f.read())
+        return offsets
+    except FileNotFoundError:
+        pass
+    offsets = build_index(path)
+    os.makedirs(INDEX_DIR, exist_ok=True)
+    tmp_path = f"{index_path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        offsets.tofile(f)
+    os.replace(tmp_path, index_path)
+    _remove_stale_indexes(path, index_path)
+    return offsets
+
+
+def _remove_stale_indexes(path, keep):
+    """Delete the indexes of earlier versions of the bank at ``path``."""
+    prefix = f"{os.path.basename(path)}."
+    for entry in os.listdir(INDEX_DIR):
+        version = entry[len(prefix):-len(".idx")].split(".")
+        if (entry.startswith(prefix) and entry.endswith(".idx") and len(version) == 2
+                and all(part.isdigit() for part in version)
+                and os.path.join(INDEX_DIR, entry) != keep):
+            try:
+                os.remove(os.path.join(INDEX_DIR, entry))
+            except OSError:
+                pass
+
+
+class QuestionBank:
+    def __init__(self, path):
+        self.path = path
+        stat = os.stat(path)
+        self.version = (stat.st_size, stat.st_mtime_ns)
+        self._offsets = load_index(path, stat)
+        self._file = _File(path)
+        # Per instance, so a reloaded bank starts with a clean cache. The
+        # cached reader holds the file but not the bank: without a cycle the
+        # fd is closed as soon as the last rerun using a replaced bank ends.
+        self.get = functools.lru_cache(maxsize=256)(_reader(self._file, self._offsets))
+
+    def __len__(self):
+        return len(self._offsets) - 1
+
+    def sample(self, k=QUESTIONS_PER_QUIZ, rng=random):
+        """Return ``k`` distinct question indices."""
+        return tuple(rng.sample(range(len(self)), min(k, len(self))))
+
+    def close(self):
+        self._file.close()
+
+
+class _File:
+    """A read-only fd, closed when the last bank or reader using it goes."""
+
+    __slots__ = ("fd",)
+
+    def __init__(self, path):
+        self.fd = os.open(path, os.O_RDONLY)
+
+    def close(self):
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+    __del__ = close
+
+
+def _reader(file, offsets):
+    def read(index):
+        start, end = offsets[index], offsets[index + 1]
+        # pread does not move a shared file position, so threads can share the fd
+        line = os.pread(file.fd, end - start, start)
+        return json.loads(line.split(b"\n", 1)[0])
+
+    return read
+
+
+_lock = threading.Lock()
+_bank = None
+
+
+def question_bank(path=BANK_PATH):
+    """Return the shared bank, reopening it if the file changed on disk."""
+    global _bank
+    stat = os.stat(path)
+    bank = _bank
+    if bank is None or bank.path != path or bank.version != (stat.st_size, stat.st_mtime_ns):
+        with _lock:
+            if _bank is None or _bank.path != path or _bank.version != (stat.st_size, stat.st_mtime_ns):
+                # Not closed here: a concurrent rerun may still be reading the
+                # old bank. Its file closes when the last reference goes.
+                _bank = QuestionBank(path)
+            bank = _bank
+    return bank
+
+
+def record_answer(question_id, correct):
+    quiz_stats.increment(f"{question_id}:attempts")
+    if correct:
+        quiz_stats.increment(f"{question_id}:correct")
+
+
+def success_rate(question_id):
+    """Share of recorded answers to ``question_id`` that were correct, or None."""
+    attempts = quiz_stats.value(f"{question_id}:attempts")
+    if not attempts:
+        return None
+    return quiz_stats.value(f"{question_id}:correct") / attempts
@@ -0,0 +1,259 @@
+"""Inverted-index search over the portfolio content and documents.
+
+The index covers skills, certifications, projects, the chart skills and
+text extracted from the PDFs/DOCX in ``assets/``. It is built once per
+process and saved to ``.cache/search/`` under a fingerprint of the content,
+the documents' sha256 and the PDF extractor in use, so restarts load it
+instead of re-extracting. An index missing a document's text because its
+extraction failed is used but not saved, so a later start tries again.
+Queries match terms exactly, by prefix (binary search over the sorted
+vocabulary) and fuzzily within one edit (a deletion-neighbourhood table),
+so answering one never scans the documents.
+"""
+
+import bisect
+import hashlib
+import json
+import logging
+import os
+import re
+import shutil
+import threading
+import zipfile
+from collections import defaultdict
+
+from portfolio import content
+from portfolio.documents import ROOT, document_store
+from portfolio.experience import skills_data
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR = os.path.join(ROOT, ".cache", "search")
+TOKEN_RE = re.compile(r"[^\W_]+", re.UNICODE)
+MIN_TOKEN = 2
+FUZZY_MIN_LENGTH = 4  # shorter words only match exactly or by prefix
+EXCERPT_LENGTH = 160
+# Longest query the sidebar accepts; each token is a fuzzy scan of the terms
+MAX_QUERY_LENGTH = 100
+
+# Scores per way a query token can match a document term
+EXACT, PREFIX, FUZZY = 3.0, 2.0, 1.0
+
+
+def tokenize(text):
+    return [t for t in TOKEN_RE.findall(text.lower()) if len(t) >= MIN_TOKEN]
+
+
+def _deletes(term):
+    return {term[:i] + term[i + 1:] for i in range(len(term))}
+
+
+def extract_docx(path):
+    with zipfile.ZipFile(path) as archive:
+        xml = archive.read("word/document.xml").decode("utf-8", "ignore")
+    xml = re.sub(r"</w:p>", "\n", xml)
+    return re.sub(r"<[^>]+>", "", xml)
+
+
+def pdf_extractor():
+    """Name and version of the PDF text extractor available, or None."""
+    try:
+        from importlib.metadata import PackageNotFoundError, version
+
+        return f"pypdfium2-{version('pypdfium2')}"
+    except PackageNotFoundError:
+        pass
+    return "pdftotext" if shutil.which("pdftotext") else None
+
+
+def extract_pdf(path):
+    try:
+        import pypdfium2 as pdfium
+    except ImportError:
+        import subprocess
+
+        # poppler fallback; raises OSError when neither exists
+        result = subprocess.run(["pdftotext", "-q", path, "-"], capture_output=True, timeout=60)
+        return result.stdout.decode("utf-8", "ignore")
+    pdf = pdfium.PdfDocument(path)
+    try:
+        texts = []
+        for page in pdf:
+            textpage = page.get_textpage()
+            texts.append(textpage.get_text_range())
+            textpage.close()
+            page.close()
+        return "\n".join(texts)
+    finally:
+        pdf.close()
+
+
+def content_entries():
+    """Yield ``(title, section, text)`` for the inline portfolio content."""
+    for skill in content.molecular_skills():
+        yield skill, "🔬 Skills", f"{skill} molecular biology"
+    for skill in content.tech_skills():
+        yield skill, "🔬 Skills", f"{skill} bioinformatics"
+    # The skills the chart actually shows: the experience log's, if any
+    for skill in skills_data()["Skill Category"]:
+        yield skill, "📊 Skills Chart", skill
+    for cert in content.certifications():
+        yield (f"{cert.title} - {cert.provider}", "🏅 Certifications",
+               " ".join([cert.title, cert.provider, cert.description, *cert.skills]))
+    for project in content.projects():
+        yield (project.title, "💼 Projects",
+               " ".join([project.title, project.type, project.description,
+                         project.impact, *project.tech]))
+
+
+def document_entries(failed=None):
+    """Yield entries for the documents; append the names that failed to ``failed``."""
+    for name, info in document_store.manifest().items():
+        try:
+            if name.lower().endswith(".docx"):
+                text = extract_docx(info.path)
+            elif name.lower().endswith(".pdf"):
+                text = extract_pdf(info.path)
+            else:
+                continue
+        except Exception:
+            # Still findable by its label
+            text = ""
+            if failed is not None:
+                failed.append(name)
+        yield info.label, "📄 Resume & Documents", f"{info.label} {text}"
+
+
+def fingerprint():
+    digest = hashlib.sha256()
+    digest.update(json.dumps(list(content_entries()), ensure_ascii=False).encode("utf-8"))
+    # Installing or upgrading the extractor changes the documents' text
+    digest.update(f"pdf:{pdf_extractor()}".encode("utf-8"))
+    for name, info in sorted(document_store.manifest().items()):
+        digest.update(f"{name}:{info.sha256}".encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
+class SearchIndex:
+    def __init__(self, docs, postings):
+        self.docs = docs  # [{"title", "section", "excerpt"}]
+        self.postings = postings  # term -> sorted doc ids
+        self.vocabulary = sorted(postings)
+        self.neighbours = defaultdict(set)  # deletion variant -> terms
+        for term in self.vocabulary:
+            if len(term) >= FUZZY_MIN_LENGTH:
+                self.neighbours[term].add(term)
+                for variant in _deletes(term):
+                    self.neighbours[variant].add(term)
+
+    @classmethod
+    def build(cls, entries):
+        docs = []
+        postings = defaultdict(set)
+        for doc_id, (title, section, text) in enumerate(entries):
+            excerpt = " ".join(text.split())[:EXCERPT_LENGTH]
+            docs.append({"title": title, "section": section, "excerpt": excerpt})
+            for term in set(tokenize(f"{title} {text}")):
+                postings[term].add(doc_id)
+        return cls(docs, {term: sorted(ids) for term, ids in postings.items()})
+
+    def save(self, path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"docs": self.docs, "postings": self.postings}, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        return cls(data["docs"], data["postings"])
+
+    def _prefix_terms(self, prefix):
+        start = bisect.bisect_left(self.vocabulary, prefix)
+        end = bisect.bisect_left(self.vocabulary, prefix + "\U0010ffff")
+        return self.vocabulary[start:end]
+
+    def _fuzzy_terms(self, token):
+        if len(token) < FUZZY_MIN_LENGTH:
+            return set()
+        found = set(self.neighbours.get(token, ()))
+        for variant in _deletes(token):
+            found |= self.neighbours.get(variant, set())
+        return found
+
+    def _match(self, token, allow_prefix):
+        """Return ``{doc_id: score}`` for one query token."""
+        scores = {}
+
+        def add(term, score):
+            for doc_id in self.postings[term]:
+                if score > scores.get(doc_id, 0.0):
+                    scores[doc_id] = score
+
+        if allow_prefix:
+            for term in self._prefix_terms(token):
+                add(term, EXACT if term == token else PREFIX)
+        elif token in self.postings:
+            add(token, EXACT)
+        for term in self._fuzzy_terms(token):
+            add(term, FUZZY)
+        return scores
+
+    def search(self, query, limit=8):
+        """Return up to ``limit`` docs matching every query token, best first."""
+        tokens = tokenize(query[:MAX_QUERY_LENGTH])
+        if not tokens:
+            return []
+        totals = None
+        for position, token in enumerate(tokens):
+            # Only the last token can still be being typed
+            scores = self._match(token, allow_prefix=position == len(tokens) - 1)
+            if totals is None:
+                totals = scores
+            else:
+                totals = {doc_id: totals[doc_id] + score for doc_id, score in scores.items() if doc_id in totals}
+            if not totals:
+                return []
+        ranked = sorted(totals.items(), key=lambda item: (-item[1], item[0]))[:limit]
+        return [dict(self.docs[doc_id], score=score) for doc_id, score in ranked]
+
+
+_lock = threading.Lock()
+_index = None
+_index_version = None  # (content registry version, chart skills) it was built from
+
+
+def search_index():
+    """Return the process-wide index, loading or building it on first use.
+
+    The index is rebuilt (or loaded from disk) when the content file or the
+    chart's skills change.
+    """
+    global _index, _index_version
+    version = (content.registry.version, tuple(skills_data()["Skill Category"]))
+    if _index is None or _index_version != version:
+        with _lock:
+            if _index is None or _index_version != version:
+                path = os.path.join(CACHE_DIR, f"index-{fingerprint()}.json")
+                try:
+                    index = SearchIndex.load(path)
+                except (OSError, ValueError, KeyError):
+                    failed = []
+                    index = SearchIndex.build([*content_entries(), *document_entries(failed)])
+                    if failed:
+                        logger.warning("text extraction failed for %s; search index not saved",
+                                       ", ".join(failed))
+                    else:
+                        try:
+                            index.save(path)
+                        except OSError:
+                            pass
+                _index, _index_version = index, version
+    return _index
+
+
+def warm():
+    """Load or build the index; run from the startup warm-up thread."""
+    search_index()
@@ -0,0 +1,221 @@
+"""Compact per-session state, memory accounting and idle-session eviction.
+
+Each session keeps one ``VisitorSession`` (a ``__slots__`` object with
+capped text fields and bitmask quiz answers) under
+``st.session_state.visitor`` instead of a handful of loose keys. A weak
+registry tracks every live session so the admin page can show per-session
+memory, and a sweeper thread compacts sessions that have been idle longer
+than ``PORTFOLIO_SESSION_IDLE_TIMEOUT`` seconds: their widget state and
+quiz progress are dropped and only the visitor's name and id are kept.
+"""
+
+import os
+import sys
+import threading
+import time
+import uuid
+import weakref
+
+import streamlit as st
+
+from portfolio.templates import escape
+
+MAX_NAME_LENGTH = 60
+IDLE_TIMEOUT = int(os.environ.get("PORTFOLIO_SESSION_IDLE_TIMEOUT", 30 * 60))
+SWEEP_INTERVAL = 60
+STATE_KEY = "visitor"
+
+
+class VisitorSession:
+    __slots__ = (
+        "session_id", "_visitor_name", "_visitor_name_html", "lite", "last_section", "last_seen", "state_bytes",
+        "quiz_taken", "quiz_score", "quiz_questions", "quiz_bank_version",
+        "quiz_answered", "quiz_correct", "__weakref__",
+    )
+
+    def __init__(self, session_id=None):
+        self.session_id = session_id or uuid.uuid4().hex
+        self._visitor_name = ""
+        self._visitor_name_html = ""
+        self.lite = False
+        self.last_section = None
+        self.last_seen = time.time()
+        self.state_bytes = 0
+        self.reset_quiz()
+
+    @property
+    def visitor_name(self):
+        return self._visitor_name
+
+    @visitor_name.setter
+    def visitor_name(self, value):
+        name = " ".join(str(value or "").split())[:MAX_NAME_LENGTH].rstrip()
+        if name != self._visitor_name:
+            self._visitor_name = name
+            # Escaped once here; the HTML fragments insert it as is
+            self._visitor_name_html = escape(name)
+
+    @property
+    def visitor_name_html(self):
+        return self._visitor_name_html
+
+    def reset_quiz(self, questions=(), bank_version=None):
+        self.quiz_taken = False
+        self.quiz_score = 0
+        self.quiz_questions = tuple(questions)
+        self.quiz_bank_version = bank_version
+        # Answers as bitmasks: bit i set = question i answered / correct
+        self.quiz_answered = 0
+        self.quiz_correct = 0
+
+    def record_answer(self, i, correct):
+        """Record an answer; return True if question ``i`` had no answer yet."""
+        first = not self.quiz_answered & (1 << i)
+        self.quiz_answered |= 1 << i
+        if correct:
+            self.quiz_correct |= 1 << i
+        else:
+            self.quiz_correct &= ~(1 << i)
+        return first
+
+    @property
+    def correct_answers(self):
+        return bin(self.quiz_correct).count("1")
+
+    def compact(self):
+        """Drop everything but identity, name and render mode."""
+        self.reset_quiz()
+        self.last_section = None
+
+
+def estimate_size(value, depth=2):
+    """Rough deep ``sys.getsizeof`` for session values (containers ``depth`` levels deep)."""
+    size = sys.getsizeof(value)
+    if depth <= 0:
+        return size
+    if isinstance(value, dict):
+        size += sum(estimate_size(k, depth - 1) + estimate_size(v, depth - 1) for k, v in value.items())
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        size += sum(estimate_size(v, depth - 1) for v in value)
+    elif hasattr(type(value), "__slots__"):
+        size += sum(estimate_size(getattr(value, slot, None), depth - 1)
+                    for slot in type(value).__slots__ if slot != "__weakref__")
+    return size
+
+
+class SessionRegistry:
+    """Weak registry of live sessions: session id -> (visitor, session state)."""
+
+    def __init__(self, idle_timeout=IDLE_TIMEOUT):
+        self.idle_timeout = idle_timeout
+        self._lock = threading.Lock()
+        self._sessions = {}  # session_id -> (weakref(visitor), weakref(state) or None)
+        self._sweeper = None
+
+    def register(self, visitor, state):
+        try:
+            state_ref = weakref.ref(state)
+        except TypeError:
+            state_ref = None
+        with self._lock:
+            self._sessions[visitor.session_id] = (weakref.ref(visitor), state_ref)
+        self._start_sweeper()
+
+    def _live(self):
+        with self._lock:
+            items = list(self._sessions.items())
+        live = []
+        for session_id, (visitor_ref, state_ref) in items:
+            visitor = visitor_ref()
+            if visitor is None:
+                with self._lock:
+                    self._sessions.pop(session_id, None)
+                continue
+            live.append((visitor, state_ref() if state_ref else None))
+        return live
+
+    def accounting(self):
+        """Return per-session memory rows, biggest first."""
+        now = time.time()
+        rows = [
+            {
+                "session": visitor.session_id[:8],
+                "idle_s": round(now - visitor.last_seen),
+                "bytes": visitor.state_bytes,
+                "section": visitor.last_section or "",
+            }
+            for visitor, _ in self._live()
+        ]
+        return sorted(rows, key=lambda row: row["bytes"], reverse=True)
+
+    def sweep(self, now=None):
+        """Compact sessions idle for longer than the timeout; return how many."""
+        now = now or time.time()
+        compacted = 0
+        for visitor, state in self._live():
+            if now - visitor.last_seen < self.idle_timeout or visitor.state_bytes == 0:
+                continue
+            if state is not None:
+                try:
+                    for key in list(state.filtered_state):
+                        if key != STATE_KEY:
+                            del state[key]
+                except Exception:
+                    # Session state internals changed or the session is
+                    # rerunning right now; try again on the next sweep
+                    continue
+            visitor.compact()
+            visitor.state_bytes = 0
+            compacted += 1
+        return compacted
+
+    def _run(self):
+        while True:
+            time.sleep(SWEEP_INTERVAL)
+            try:
+                self.sweep()
+            except Exception:
+                pass
+
+    def _start_sweeper(self):
+        if self._sweeper is None:
+            with self._lock:
+                if self._sweeper is None:
+                    self._sweeper = threading.Thread(target=self._run, name="portfolio-sessions", daemon=True)
+                    self._sweeper.start()
+
+
+registry = SessionRegistry()
+
+
+def _script_session_state():
+    from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+    ctx = get_script_run_ctx()
+    return ctx.session_state if ctx is not None else None
+
+
+def current_visitor():
+    """Return this session's VisitorSession and whether it was just created."""
+    visitor = st.session_state.get(STATE_KEY)
+    created = visitor is None
+    if created:
+        visitor = st.session_state[STATE_KEY] = VisitorSession()
+        state = _script_session_state()
+        if state is not None:
+            registry.register(visitor, state)
+    visitor.last_seen = time.time()
+    return visitor, created
+
+
+def touch():
+    """Mark the session active from a fragment rerun, which skips the main script."""
+    visitor = st.session_state.get(STATE_KEY)
+    if visitor is not None:
+        visitor.last_seen = time.time()
+
+
+def account(visitor):
+    """Update the visitor's estimate of the whole session state's size."""
+    state = st.session_state
+    visitor.state_bytes = sum(estimate_size(key, 0) + estimate_size(state[key]) for key in list(state.keys()))
@@ -0,0 +1,119 @@
+"""Build the minified theme stylesheet and publish the self-hosted fonts.
+
+The CSS source lives in ``assets/<name>.css``. On first use in a process it
+is minified once and prefixed with ``@font-face`` rules for the fonts in
+``assets/fonts/``; pages inline the result in a ``<style>`` tag.
+
+The sheet is not served from ``static/``: Streamlit's static handler sends
+every file that is not an image or PDF as ``text/plain`` with
+``X-Content-Type-Options: nosniff``, and browsers refuse such a stylesheet.
+``nosniff`` only applies to scripts and styles, so the fonts are served from
+there: they are copied to ``static/fonts/`` under hashed names, and the
+``?v=`` query makes Tornado send a ten-year ``Cache-Control``.
+"""
+
+import hashlib
+import os
+import re
+import shutil
+import threading
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ASSETS_DIR = os.path.join(ROOT, "assets")
+FONTS_DIR = os.path.join(ASSETS_DIR, "fonts")
+STATIC_DIR = os.path.join(ROOT, "static")
+STATIC_URL = "app/static"
+
+# Self-hosted Open Sans latin subset: (weight, file in assets/fonts).
+# If static/ is not writable the system font stack is used instead.
+FONT_FACES = [
+    (300, "open-sans-latin-300.woff2"),
+    (400, "open-sans-latin-400.woff2"),
+    (600, "open-sans-latin-600.woff2"),
+    (700, "open-sans-latin-700.woff2"),
+]
+# Stylesheets that load the web fonts; the others use the system font stack
+WEBFONT_SHEETS = ("theme",)
+LATIN_RANGE = "U+0000-00FF,U+0131,U+0152-0153,U+02BB-02BC,U+02C6,U+02DA,U+02DC,U+2000-206F,U+2074,U+20AC,U+2122,U+2191,U+2193,U+2212,U+2215,U+FEFF,U+FFFD"
+
+_lock = threading.Lock()
+_built = {}  # stylesheet name -> Stylesheet
+
+
+class Stylesheet:
+    def __init__(self, name, css, digest):
+        self.name = name
+        self.css = css
+        self.digest = digest
+
+    def style_tag(self):
+        return f"<style>{self.css}</style>"
+
+
+def content_hash(data):
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    return hashlib.sha256(data).hexdigest()[:12]
+
+
+def minify_css(css):
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r"\s*([{};,>])\s*", r"\1", css)
+    css = re.sub(r":\s+", ":", css)
+    css = css.replace(";}", "}")
+    return css.strip()
+
+
+def font_face_rule(weight, url):
+    """Return the ``@font-face`` rule for one Open Sans weight served at ``url``."""
+    return (
+        "@font-face{font-family:'Open Sans';font-style:normal;"
+        f"font-weight:{weight};font-display:swap;"
+        f"src:url({url}) format('woff2');"
+        f"unicode-range:{LATIN_RANGE}}}"
+    )
+
+
+def publish_fonts():
+    """Copy available fonts to static/ under hashed names; return @font-face CSS."""
+    rules = []
+    for weight, filename in FONT_FACES:
+        source = os.path.join(FONTS_DIR, filename)
+        if not os.path.exists(source):
+            continue
+        with open(source, "rb") as f:
+            digest = content_hash(f.read())
+        stem, ext = os.path.splitext(filename)
+        target_name = f"{stem}.{digest}{ext}"
+        target = os.path.join(STATIC_DIR, "fonts", target_name)
+        if not os.path.exists(target):
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            shutil.copyfile(source, target)
+        # The sheet is inlined, so the URL is relative to the page
+        rules.append(font_face_rule(weight, f"{STATIC_URL}/fonts/{target_name}?v={digest}"))
+    return "".join(rules)
+
+
+def build_stylesheet(name="theme"):
+    """Minify ``assets/<name>.css``, with ``@font-face`` rules for web-font sheets."""
+    with open(os.path.join(ASSETS_DIR, f"{name}.css"), encoding="utf-8") as f:
+        css = minify_css(f.read())
+    if name in WEBFONT_SHEETS:
+        try:
+            css = publish_fonts() + css
+        except OSError:
+            # Read-only deploy without prebuilt fonts: use the system font stack
+            pass
+    return Stylesheet(name, css, content_hash(css))
+
+
+def get_stylesheet(name="theme"):
+    """Return the built stylesheet, building it at most once per process."""
+    sheet = _built.get(name)
+    if sheet is None:
+        with _lock:
+            sheet = _built.get(name)
+            if sheet is None:
+                sheet = _built[name] = build_stylesheet(name)
+    return sheet
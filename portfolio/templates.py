@@ -0,0 +1,116 @@
+"""Precompiled HTML fragments for the hero header, cards and footer.
+
+Each fragment is parsed once at import into literal chunks and field
+names, with the source indentation stripped. Every value is HTML-escaped
+on insertion unless it is already ``Markup``; the visitor's name is
+escaped once when it is entered (``VisitorSession.visitor_name_html``).
+Rendered fragments are memoized with an LRU keyed by the few inputs that
+change (content records are immutable namedtuples, so a content reload is
+a new key), so a rerun usually reuses the exact same string.
+"""
+
+import functools
+import html
+import re
+from string import Formatter
+
+# Distinct visitor names / visitor counts kept per fragment
+CACHE_SIZE = 256
+
+
+class Markup(str):
+    """Text that is already HTML-safe and is inserted as is."""
+
+    __slots__ = ()
+
+
+def escape(value):
+    if isinstance(value, Markup):
+        return value
+    return Markup(html.escape(str(value)))
+
+
+class Template:
+    """An HTML snippet parsed once into literal chunks and field names."""
+
+    def __init__(self, source):
+        source = re.sub(r">\s+<", "><", " ".join(line.strip() for line in source.strip().splitlines()))
+        self.parts = tuple((literal, field) for literal, field, _, _ in Formatter().parse(source))
+
+    def render(self, **values):
+        out = []
+        for literal, field in self.parts:
+            out.append(literal)
+            if field is not None:
+                out.append(escape(values[field]))
+        return Markup("".join(out))
+
+
+HERO = Template("""
+    <div class="main-header">
+        <div class="floating-icon">🧬</div>
+        <h1>{name}</h1>
+        <h3>{title}</h3>
+        <p>{tagline}</p>
+        <p>📍 {location} | 📞 {phone}</p>
+        <p><strong>{greeting}</strong></p>
+    </div>
+""")
+
+CERTIFICATION = Template("""
+    <div class="certification-card">
+        <p>{description}</p>
+        <p><em>Skills Gained:</em></p>
+        <ul>{skills}</ul>
+    </div>
+""")
+
+PROJECT = Template("""
+    <div class="project-card">
+        <h3>{title}</h3>
+        <p><em>Type:</em> {type}</p>
+        <p><em>Description:</em> {description}</p>
+        <p><em>Impact:</em> {impact}</p>
+    </div>
+""")
+
+LIST_ITEM = Template("<li>{text}</li>")
+
+FOOTER = Template("""
+    <div style="text-align: center; color: #4caf50; padding: 2rem 0;">
+        <p>© 2025 Youssef Mohamed Ali | Built with ❤ using Streamlit</p>
+        <p>🧬 <em>Pioneering biotechnology for a healthier future</em></p>
+        <p>👀 {visitors} visitors so far</p>
+        {thanks}
+    </div>
+""")
+
+THANKS = Template("<p>🎉 Thanks for visiting, {name}!</p>")
+
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def hero_html(hero, name_html=""):
+    """The Home header for ``hero``, greeting ``name_html`` (already escaped)."""
+    if name_html:
+        greeting = Markup(f"Welcome, {name_html}!")
+    else:
+        greeting = "Welcome to my Biotech Portfolio!"
+    return HERO.render(greeting=greeting, **hero._asdict())
+
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def certification_html(cert):
+    skills = Markup("".join(LIST_ITEM.render(text=skill) for skill in cert.skills))
+    return CERTIFICATION.render(description=cert.description, skills=skills)
+
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def project_html(project):
+    return PROJECT.render(title=project.title, type=project.type,
+                          description=project.description, impact=project.impact)
+
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def footer_html(visitors, name_html=""):
+    thanks = THANKS.render(name=Markup(name_html)) if name_html else ""
+    return FOOTER.render(visitors=f"{visitors:,}", thanks=thanks)
@@ -0,0 +1,32 @@
+"""Publish the self-hosted fonts into static/ and report the stylesheet sizes.
+
+Run at deploy time when the app directory is read-only in production.
+
+    python scripts/build_static.py
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from portfolio.static_assets import WEBFONT_SHEETS, build_stylesheet, publish_fonts  # noqa: E402
+
+
+def main(argv=None):
+    names = (argv if argv is not None else sys.argv[1:]) or ["theme", "lite"]
+    try:
+        fonts = publish_fonts()
+    except OSError as exc:
+        print(f"static/ is not writable, fonts will not be served: {exc}")
+        return 1
+    print(f"fonts: {fonts.count('@font-face')} faces in static/fonts/")
+    for name in names:
+        sheet = build_stylesheet(name)
+        fonts = " with web fonts" if name in WEBFONT_SHEETS else ""
+        print(f"{name}: {len(sheet.css)} bytes inlined{fonts}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
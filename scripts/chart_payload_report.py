@@ -0,0 +1,40 @@
+"""Report the websocket payload size of every cached Skills Chart figure.
+
+    python scripts/chart_payload_report.py
+    python scripts/chart_payload_report.py --json
+"""
+
+import argparse
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from portfolio.charts import CHART_TYPES, figure_cache  # noqa: E402
+from portfolio.experience import skills_data  # noqa: E402
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args(argv)
+
+    data = skills_data()
+    for chart_type in CHART_TYPES:
+        figure_cache.get(chart_type, data)
+    report = figure_cache.payload_report()
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return 0
+
+    print(f"{'chart':<14}{'raw':>10}{'payload':>10}{'saved':>8}")
+    for row in report:
+        saved = 1 - row["payload_bytes"] / row["raw_bytes"] if row["raw_bytes"] else 0.0
+        print(f"{row['chart_type']:<14}{row['raw_bytes']:>10}{row['payload_bytes']:>10}{saved:>8.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
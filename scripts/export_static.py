@@ -0,0 +1,41 @@
+"""Export the read-only sections as a static site for CDN hosting.
+
+    python scripts/export_static.py --out dist --app-url https://portfolio.example.com
+
+Serve ``dist/`` from any file server; hashed files under ``dist/assets/``
+can be cached forever. The quiz and contact links point at ``--app-url``.
+``--out`` is replaced only if it is empty or a previous export, unless
+``--force`` is given.
+"""
+
+import argparse
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from portfolio.export import ExportError, Exporter  # noqa: E402
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--out", default=os.path.join(ROOT, "dist"), help="output directory (a previous export is replaced)")
+    parser.add_argument("--app-url", default="http://localhost:8501",
+                        help="URL of the live Streamlit app for the interactive sections")
+    parser.add_argument("--force", action="store_true",
+                        help="replace --out even if it holds files from elsewhere")
+    args = parser.parse_args(argv)
+
+    try:
+        written = Exporter(args.out, args.app_url, force=args.force).export()
+    except ExportError as exc:
+        parser.exit(1, f"error: {exc}\n")
+    for name in written:
+        size = os.path.getsize(os.path.join(args.out, name))
+        print(f"{size:>10}  {name}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,79 @@
+"""Import-time report for the portfolio app.
+
+Runs ``python -X importtime`` in a fresh interpreter for each target module
+and prints the slowest imports by cumulative time. Exits non-zero when the
+startup modules take longer than ``--budget-ms`` or pull in one of the
+heavy modules that should only load lazily, so it can gate CI. Heavy
+modules that a bare ``import streamlit`` already loads (it imports
+``plotly.graph_objects`` itself) are not counted against the app.
+
+    python scripts/importtime_report.py
+    python scripts/importtime_report.py --budget-ms 1500 --top 15
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from portfolio.lazy import HEAVY_MODULES  # noqa: E402
+
+# Modules every visitor loads on the first rerun
+STARTUP_MODULES = ("chrome", "sections", "sections.home")
+# What the app cannot avoid importing; its heavy imports are not flagged
+BASELINE_MODULE = "streamlit"
+
+
+def measure(module):
+    """Return ``[(cumulative_us, self_us, name), ...]`` for importing ``module``."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT, capture_output=True, text=True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"importing {module} failed:\n{proc.stderr.strip()}")
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        rows.append((int(cumulative_us), int(self_us), name.rstrip()))
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("modules", nargs="*", default=list(STARTUP_MODULES),
+                        help="modules to import (default: startup modules)")
+    parser.add_argument("--top", type=int, default=10, help="rows to show per module")
+    parser.add_argument("--budget-ms", type=float, default=None,
+                        help="fail if any module's total import time exceeds this")
+    args = parser.parse_args(argv)
+
+    baseline = {name.strip() for _, _, name in measure(BASELINE_MODULE)}
+    failures = []
+    for module in args.modules:
+        rows = measure(module)
+        total_ms = max(rows)[0] / 1000 if rows else 0.0
+        print(f"== {module}: {total_ms:.1f} ms")
+        for cumulative, self_us, name in sorted(rows, reverse=True)[:args.top]:
+            print(f"  {cumulative / 1000:9.1f} ms  {self_us / 1000:8.1f} ms self  {name.strip()}")
+
+        imported = {name.strip() for _, _, name in rows}
+        if module in STARTUP_MODULES:
+            eager = sorted(imported.intersection(HEAVY_MODULES) - baseline)
+            if eager:
+                failures.append(f"{module} eagerly imports {', '.join(eager)}")
+        if args.budget_ms is not None and total_ms > args.budget_ms:
+            failures.append(f"{module} took {total_ms:.1f} ms (budget {args.budget_ms:.0f} ms)")
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
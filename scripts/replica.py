@@ -0,0 +1,47 @@
+"""Run one Streamlit replica, warming its caches before it takes traffic.
+
+Starts the metrics/health HTTP server and the warm-up thread first, then
+the Streamlit server in the same process, so ``/readyz`` turns ready only
+once imports, page modules, figures and indexes are loaded. Normally
+started by ``scripts/run_replicas.py``.
+
+    python scripts/replica.py --port 8601 --metrics-port 9601
+"""
+
+import argparse
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP = os.path.join(ROOT, "portfoliomainfile.py")
+sys.path.insert(0, ROOT)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--port", type=int, required=True, help="Streamlit server port")
+    parser.add_argument("--address", default="127.0.0.1", help="Streamlit bind address")
+    parser.add_argument("--metrics-port", type=int, default=None,
+                        help="port for /metrics, /healthz and /readyz")
+    args = parser.parse_args(argv)
+
+    # .streamlit/config.toml is read from the working directory
+    os.chdir(ROOT)
+    if args.metrics_port:
+        os.environ["PORTFOLIO_METRICS_PORT"] = str(args.metrics_port)
+
+    from portfolio.lazy import start_warmup
+    from portfolio.metrics import start_exporters
+    from streamlit.web import bootstrap
+
+    start_exporters()
+    start_warmup()
+
+    flag_options = {"server_port": args.port, "server_address": args.address, "server_headless": True}
+    bootstrap.load_config_options(flag_options=flag_options)
+    bootstrap.run(APP, False, [], flag_options)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
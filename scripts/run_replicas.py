@@ -0,0 +1,105 @@
+"""Run N app replicas pinned to CPU cores behind the local replica proxy.
+
+Replica i listens on ``--base-port + i`` with its health probes on
+``--metrics-base-port + i`` and is pinned to one core (round robin over the
+cores this process may use). The proxy listens on ``--port`` and only
+routes to replicas whose ``/readyz`` says they are warm, and passes the
+client address in X-Forwarded-For; replicas listen on 127.0.0.1 only and
+trust one more proxy hop than ``PORTFOLIO_TRUSTED_PROXIES`` says (for a
+proxy in front of this one). Replicas that exit are restarted. Counters,
+the contact outbox and rate limits are shared through the SQLite database
+in ``PORTFOLIO_DATA_DIR``.
+
+    python scripts/run_replicas.py                  # one replica per core
+    python scripts/run_replicas.py --replicas 4 --port 8501
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+REPLICA = os.path.join(ROOT, "scripts", "replica.py")
+sys.path.insert(0, ROOT)
+
+from portfolio.proxy import Backend, ReplicaProxy  # noqa: E402
+
+RESTART_DELAY = 2  # seconds between a replica exiting and its restart
+# Replicas read the client address appended by the proxy
+TRUSTED_PROXIES = int(os.environ.get("PORTFOLIO_TRUSTED_PROXIES", "0")) + 1
+
+
+def available_cores():
+    if hasattr(os, "sched_getaffinity"):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
+
+
+def start_replica(port, metrics_port, core):
+    """Start one replica process, pinned to ``core`` where the OS supports it."""
+    def pin():
+        os.sched_setaffinity(0, {core})
+
+    env = dict(os.environ, PORTFOLIO_TRUSTED_PROXIES=str(TRUSTED_PROXIES))
+    return subprocess.Popen(
+        [sys.executable, REPLICA, "--port", str(port), "--metrics-port", str(metrics_port)],
+        cwd=ROOT, env=env, preexec_fn=pin if hasattr(os, "sched_setaffinity") else None,
+    )
+
+
+async def supervise(specs, processes):
+    while True:
+        await asyncio.sleep(RESTART_DELAY)
+        for i, process in enumerate(processes):
+            if process.poll() is not None:
+                logging.warning("replica %d exited with %s; restarting", i, process.returncode)
+                processes[i] = start_replica(*specs[i])
+
+
+async def run(args, specs, processes):
+    backends = [Backend("127.0.0.1", port, metrics_port) for port, metrics_port, _ in specs]
+    proxy = ReplicaProxy(backends, check_interval=args.check_interval)
+    supervisor = asyncio.create_task(supervise(specs, processes))
+    try:
+        await proxy.serve(args.host, args.port)
+    finally:
+        supervisor.cancel()
+
+
+def main(argv=None):
+    cores = available_cores()
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--replicas", type=int, default=len(cores), help="default: one per available core")
+    parser.add_argument("--host", default="0.0.0.0", help="proxy bind address")
+    parser.add_argument("--port", type=int, default=8501, help="proxy port")
+    parser.add_argument("--base-port", type=int, default=8601, help="port of replica 0")
+    parser.add_argument("--metrics-base-port", type=int, default=9601, help="health/metrics port of replica 0")
+    parser.add_argument("--check-interval", type=float, default=1.0, help="seconds between readiness polls")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
+
+    specs = [(args.base_port + i, args.metrics_base_port + i, cores[i % len(cores)]) for i in range(args.replicas)]
+    processes = [start_replica(*spec) for spec in specs]
+    for (port, metrics_port, core) in specs:
+        logging.info("replica on :%d (health :%d) pinned to core %d", port, metrics_port, core)
+    logging.info("proxy on %s:%d", args.host, args.port)
+    try:
+        asyncio.run(run(args, specs, processes))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        for process in processes:
+            process.terminate()
+        for process in processes:
+            try:
+                process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                process.kill()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,56 @@
+"""Page registry for the portfolio.
+
+Each section of the site lives in its own module with a ``render()``
+function. Only the module of the selected section is imported, and only
+its ``render()`` runs on a rerun, so visiting the Home page never pays for
+plotly or the quiz code.
+"""
+
+import hmac
+import importlib
+import os
+
+import streamlit as st
+
+# Menu label -> module in this package, in sidebar order
+SECTIONS = {
+    "🏠 Home": "home",
+    "👨‍🔬 About Me": "about",
+    "🔬 Skills": "skills",
+    "🏅 Certifications": "certifications",
+    "💼 Projects": "projects",
+    "🎯 Interactive Quiz": "quiz",
+    "📊 Skills Chart": "skills_chart",
+    "📄 Resume & Documents": "documents",
+    "📞 Contact": "contact",
+}
+
+DEFAULT_SECTION = "🏠 Home"
+
+# Not in the menu; reached with ?admin=<PORTFOLIO_ADMIN_TOKEN>
+ADMIN_SECTION = "🛠 Admin"
+HIDDEN_SECTIONS = {
+    ADMIN_SECTION: "admin",
+}
+
+
+def admin_requested():
+    token = os.environ.get("PORTFOLIO_ADMIN_TOKEN")
+    given = st.query_params.get("admin")
+    return bool(token and given) and hmac.compare_digest(token, given)
+
+
+def load_section(label):
+    """Import (on first use) and return the module for a menu label."""
+    module_name = SECTIONS.get(label) or HIDDEN_SECTIONS.get(label) or SECTIONS[DEFAULT_SECTION]
+    return importlib.import_module(f"{__name__}.{module_name}")
+
+
+def render_section(label):
+    load_section(label).render()
+
+
+def warm():
+    """Import every page module ahead of its first visit."""
+    for module_name in [*SECTIONS.values(), *HIDDEN_SECTIONS.values()]:
+        importlib.import_module(f"{__name__}.{module_name}")
@@ -0,0 +1,27 @@
+"""About Me page: biotech journey timeline and fun facts."""
+
+import streamlit as st
+
+from portfolio import content
+
+
+def render():
+    st.markdown('<h2 class="section-header">🎯 About Me</h2>', unsafe_allow_html=True)
+    
+    # Interactive timeline
+    if st.button("📅 Show Biotech Journey"):
+        with st.expander("🎓 My Biotech Journey", expanded=True):
+            st.markdown("\n\n".join(f"*{year}* - {event}" for year, event in content.journey()))
+    
+    # Interactive personality test
+    st.markdown("### 🧬 Discover My Biotech Passion!")
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        if st.button("🔬 My Research Interests"):
+            st.info(content.research_interests())
+    
+    with col2:
+        if st.button("⚡ Biotech Fun Facts"):
+            for fact in content.fun_facts():
+                st.write(fact)
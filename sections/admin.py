@@ -0,0 +1,58 @@
+"""Hidden admin page: per-section render timings for this process."""
+
+import os
+
+import streamlit as st
+
+from portfolio import metrics
+from portfolio.session import registry
+
+
+def render():
+    st.markdown('<h2 class="section-header">🛠 Render Metrics</h2>', unsafe_allow_html=True)
+    st.caption(f"Process {os.getpid()} · histograms since start")
+    
+    rows = metrics.summary()
+    if not rows:
+        st.info("No reruns recorded yet.")
+    else:
+        st.dataframe(
+            [
+                {
+                    "Section": row["name"],
+                    "Reruns": row["reruns"],
+                    "Mean (ms)": round(row["mean_ms"], 2),
+                    "p50 (ms)": round(row["p50_ms"], 2),
+                    "p95 (ms)": round(row["p95_ms"], 2),
+                    "Mean payload (bytes)": round(row["mean_bytes"]),
+                }
+                for row in rows
+            ],
+            use_container_width=True,
+            hide_index=True,
+        )
+    
+        with st.expander("📄 Prometheus export"):
+            st.code(metrics.render_prometheus(), language="text")
+
+    st.markdown("### 🧠 Session Memory")
+    sessions = registry.accounting()
+    total = sum(row["bytes"] for row in sessions)
+    col1, col2, col3 = st.columns(3)
+    col1.metric("Live sessions", len(sessions))
+    col2.metric("Session state", f"{total / 1024:.0f} KiB")
+    col3.metric("Idle timeout", f"{registry.idle_timeout // 60} min")
+    if sessions:
+        st.dataframe(
+            [
+                {
+                    "Session": row["session"],
+                    "Idle (s)": row["idle_s"],
+                    "State (bytes)": row["bytes"],
+                    "Section": row["section"],
+                }
+                for row in sessions[:200]
+            ],
+            use_container_width=True,
+            hide_index=True,
+        )
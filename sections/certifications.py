@@ -0,0 +1,30 @@
+"""Certifications page."""
+
+import streamlit as st
+
+from portfolio import content
+from portfolio.metrics import track
+from portfolio.session import touch
+from portfolio.templates import certification_html
+
+
+@st.fragment
+def verify_button(i):
+    # Fragment: verifying reruns only this button, not the whole page
+    with track("fragment:verify"):
+        touch()
+        if st.button("🎖 Verify", key=f"cert_{i}"):
+            st.success("Certificate verified! ✅")
+
+
+def render():
+    st.markdown('<h2 class="section-header">🏅 Biotech Certifications</h2>', unsafe_allow_html=True)
+    
+    for i, cert in enumerate(content.certifications()):
+        with st.expander(f"{cert.title} - {cert.provider}", expanded=False):
+            col1, col2 = st.columns([2, 1])
+            with col1:
+                # One cached HTML element instead of a write per skill
+                st.markdown(certification_html(cert), unsafe_allow_html=True)
+            with col2:
+                verify_button(i)
@@ -0,0 +1,76 @@
+"""Contact page: contact form."""
+
+import os
+
+import streamlit as st
+
+from portfolio import content, lite
+from portfolio.metrics import track
+from portfolio.outbox import MAX_LENGTHS, OutboxError, outbox
+from portfolio.session import touch
+
+# Reverse proxies in front of the app that append to X-Forwarded-For. The
+# header is ignored unless this is set, since clients can send it too.
+TRUSTED_PROXIES = int(os.environ.get("PORTFOLIO_TRUSTED_PROXIES", "0"))
+
+
+def client_ip():
+    """Visitor IP for the per-IP contact limit, or None if it is unknown.
+
+    Behind proxies this is the address the outermost trusted proxy saw:
+    counted from the right of X-Forwarded-For, as entries further left are
+    whatever the client sent. Without proxies it is the socket address,
+    which Streamlit only exposes from 1.45 on; on older versions the
+    per-IP limit is off and only the per-session limit applies.
+    """
+    if TRUSTED_PROXIES:
+        hops = [hop.strip() for hop in st.context.headers.get("X-Forwarded-For", "").split(",")]
+        if len(hops) < TRUSTED_PROXIES or not hops[-TRUSTED_PROXIES]:
+            return None
+        return hops[-TRUSTED_PROXIES]
+    return getattr(st.context, "ip_address", None)
+
+
+@st.fragment
+def contact_form():
+    # Fragment: typing and sending only rerun the form, not the whole page
+    with track("fragment:contact_form"):
+        touch()
+        contact_reason = st.selectbox(
+            "🎯 What's the purpose of your message?",
+            content.contact_reasons()
+        )
+        
+        if contact_reason:
+            st.write(f"Great! You selected: *{contact_reason}*")
+            
+            col1, col2 = st.columns(2)
+            with col1:
+                name = st.text_input("👤 Your Name *", max_chars=MAX_LENGTHS["name"])
+                email = st.text_input("📧 Your Email *", max_chars=MAX_LENGTHS["email"])
+            
+            with col2:
+                company = st.text_input("🏢 Company/Institution", max_chars=MAX_LENGTHS["company"])
+                phone = st.text_input("📞 Phone Number", max_chars=MAX_LENGTHS["phone"])
+            
+            message = st.text_area("💬 Your Message *", height=150, max_chars=MAX_LENGTHS["message"],
+                                  placeholder="Share your thoughts on biotech collaboration, opportunities, or research ideas...")
+            
+            if st.button("🚀 Send Message"):
+                fields = {"name": name, "email": email, "company": company, "phone": phone,
+                          "reason": contact_reason, "message": message}
+                try:
+                    # Only queues the message; delivery happens on the outbox worker
+                    outbox.submit(fields, session_id=st.session_state.visitor.session_id, client_ip=client_ip())
+                except OutboxError as exc:
+                    st.error(f"❗ {exc}")
+                else:
+                    st.success("🎉 Thank you! Your message has been sent successfully!")
+                    lite.celebrate()
+                    st.info("I'll respond within 24 hours!")
+
+
+def render():
+    st.markdown('<h2 class="section-header">📬 Let\'s Connect!</h2>', unsafe_allow_html=True)
+    
+    contact_form()
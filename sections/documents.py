@@ -0,0 +1,70 @@
+"""Resume & Documents page: downloads served from the shared document cache."""
+
+import streamlit as st
+
+from portfolio.documents import document_store
+from portfolio.previews import preview_service
+
+POSTER = "poster final EDIT 5 #.pdf"
+
+
+def _format_size(size):
+    if size >= 1 << 20:
+        return f"{size / (1 << 20):.1f} MB"
+    return f"{size / 1024:.0f} KB"
+
+
+def show_preview(name, with_pages=True):
+    """Show the cached thumbnail (and page previews) of a PDF, if ready."""
+    info = document_store.info(name)
+    if info is None or info.mime != "application/pdf":
+        return
+    previews = preview_service.get(name)
+    if previews is None:
+        if preview_service.failed(name) is None:
+            st.caption("🖼 Preview is being prepared...")
+        return
+    if previews.thumbnail:
+        st.image(previews.thumbnail, use_container_width=True)
+    if with_pages and len(previews.pages) > 1:
+        with st.expander("📑 Preview pages"):
+            for page in previews.pages:
+                st.image(page, use_container_width=True)
+
+
+def render():
+    st.markdown('<h2 class="section-header">📄 Resume & Documents</h2>', unsafe_allow_html=True)
+    
+    manifest = document_store.manifest()
+    if not manifest:
+        st.info("No documents are available right now.")
+        return
+    
+    # Only the selected document is handed to the browser on each rerun
+    names = list(manifest)
+    name = st.selectbox("📂 Choose a document:", names,
+                        format_func=lambda n: manifest[n].label)
+    info = document_store.info(name)
+    data = document_store.read(name)
+    if info is None or data is None:
+        # Deleted since the manifest was built; it is gone from the list now
+        st.warning("This document is no longer available.")
+        return
+    
+    col1, col2 = st.columns([2, 1])
+    with col1:
+        st.markdown(f"### {info.label}")
+        st.write(f"*File:* {info.name}")
+        st.write(f"*Size:* {_format_size(info.size)}")
+        st.caption(f"SHA-256: {info.sha256}")
+    
+    with col2:
+        st.download_button("⬇ Download", data=data,
+                           file_name=info.name, mime=info.mime, key="doc_download")
+        compressed = document_store.gzipped(name)
+        if compressed is not None:
+            st.download_button(f"🗜 Compressed ({_format_size(len(compressed))})",
+                               data=compressed, file_name=f"{info.name}.gz",
+                               mime="application/gzip", key="doc_download_gz")
+    
+    show_preview(name)
@@ -0,0 +1,44 @@
+"""Home page: hero header, profile photo and social buttons."""
+
+import streamlit as st
+
+from portfolio import content, lite
+from portfolio.images import profile_photo, responsive_image
+from portfolio.importer import profile_url
+from portfolio.templates import hero_html
+
+
+def profile_button(label, source, key):
+    # Link straight to the imported profile when one is configured
+    url = profile_url(source)
+    if url:
+        st.link_button(label, url)
+    elif st.button(label, key=key):
+        lite.celebrate()
+        st.success(f"Opening {label.split(' ', 1)[1]} profile...")
+
+
+def render():
+    # Header Section with animation; a cached fragment per visitor name
+    visitor = st.session_state.visitor
+    st.markdown(hero_html(content.hero(), visitor.visitor_name_html), unsafe_allow_html=True)
+    
+    # Interactive profile section
+    col1, col2, col3 = st.columns([1, 2, 1])
+    
+    with col2:
+        # Local, pre-resized photo; no third-party request from the browser.
+        # Lite mode sends the smallest variant.
+        width = 150 if lite.enabled() else 300
+        st.image(responsive_image(profile_photo(), width), width=width)
+        
+        # Interactive buttons
+        col_a, col_b, col_c = st.columns(3)
+        with col_a:
+            profile_button("💼 LinkedIn", "linkedin", "linkedin_btn")
+        with col_b:
+            profile_button("📚 ResearchGate", "researchgate", "researchgate_btn")
+        with col_c:
+            if st.button("📧 Email", key="email_btn"):
+                lite.celebrate()
+                st.success("Opening email client...")
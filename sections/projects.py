@@ -0,0 +1,40 @@
+"""Projects page: project showcase and metrics."""
+
+import streamlit as st
+
+from portfolio import content
+from portfolio.documents import document_store
+from portfolio.importer import publication_count
+from portfolio.templates import project_html
+from sections.documents import POSTER, show_preview
+
+
+def render():
+    st.markdown('<h2 class="section-header">💼 Biotech Project Showcase</h2>', unsafe_allow_html=True)
+    
+    projects = content.projects()
+    project = st.selectbox("🔍 Select a project to explore:", projects,
+                           format_func=lambda p: f"{p.title} - {p.type}")
+    project_index = projects.index(project)
+    
+    col1, col2 = st.columns([2, 1])
+    with col1:
+        # Cached card for the selected project
+        st.markdown(project_html(project), unsafe_allow_html=True)
+        
+        if st.button("🔍 Show Technical Details", key=f"proj_{project_index}"):
+            st.write("*Technologies Used:*")
+            for tech in project.tech:
+                st.write(f"• {tech}")
+    
+    with col2:
+        st.markdown("### 📊 Project Metrics")
+        for label, value, icon in content.project_metrics():
+            if label == "Publications" and publication_count() is not None:
+                value = f"{publication_count()} papers"
+            st.metric(label, value, icon)
+    
+    # Poster thumbnail instead of shipping the whole PDF
+    if document_store.info(POSTER) is not None:
+        st.markdown("### 🖼 Research Poster")
+        show_preview(POSTER, with_pages=False)
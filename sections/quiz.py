@@ -0,0 +1,77 @@
+"""Interactive Quiz page."""
+
+import streamlit as st
+
+from portfolio import lite
+from portfolio.counters import QUIZ_COMPLETIONS, counters
+from portfolio.metrics import track
+from portfolio.quiz import question_bank, record_answer, success_rate
+from portfolio.session import touch
+
+
+def _start_quiz(visitor, bank):
+    # Each session draws its own questions; only their indices are kept
+    visitor.reset_quiz(bank.sample(), bank.version)
+
+
+@st.fragment
+def question(i, q):
+    # Fragment: submitting an answer reruns only this question. The result
+    # is kept on the session's visitor so Finish Quiz can add it up.
+    with track("fragment:quiz_question"):
+        touch()
+        st.write(f"*Question {i+1}:* {q['question']}")
+        answer = st.radio(f"Choose your answer for Q{i+1}:", q['options'], key=f"q{i}")
+        if st.button(f"Submit Answer {i+1}", key=f"submit_{i}"):
+            correct = q['options'].index(answer) == q['correct']
+            # Only the first attempt counts towards the question's statistics
+            if st.session_state.visitor.record_answer(i, correct):
+                record_answer(q['id'], correct)
+            if correct:
+                st.success("✅ Correct!")
+            else:
+                st.error(f"❌ Incorrect. The right answer is: {q['options'][q['correct']]}")
+            rate = success_rate(q['id'])
+            if rate is not None:
+                st.caption(f"📊 {rate:.0%} of visitors got this one right")
+
+
+def render():
+    st.markdown('<h2 class="section-header">🎯 Biotechnology Knowledge Quiz</h2>', unsafe_allow_html=True)
+    
+    st.markdown("""
+    <div class="quiz-container">
+        <h3>🧠 Test Your Biotech Knowledge!</h3>
+        <p>Take this fun quiz to explore biotechnology concepts!</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    visitor = st.session_state.visitor
+    bank = question_bank()
+    if visitor.quiz_bank_version != bank.version:
+        _start_quiz(visitor, bank)
+    total = len(visitor.quiz_questions)
+    
+    if not visitor.quiz_taken:
+        for i, index in enumerate(visitor.quiz_questions):
+            question(i, bank.get(index))
+        
+        if st.button("🎉 Finish Quiz"):
+            visitor.quiz_score = visitor.correct_answers
+            visitor.quiz_taken = True
+            counters.increment(QUIZ_COMPLETIONS)
+            st.rerun()
+    
+    else:
+        st.success(f"🎉 Quiz Completed! Your Score: {visitor.quiz_score}/{total}")
+        if visitor.quiz_score == total:
+            lite.celebrate()
+            st.write("🏆 Perfect Score! You're a biotech expert!")
+        elif visitor.quiz_score >= 2:
+            st.write("👏 Great job! Strong biotech knowledge!")
+        else:
+            st.write("📚 Keep exploring biotechnology!")
+        
+        if st.button("🔄 Retake Quiz"):
+            _start_quiz(visitor, bank)
+            st.rerun()
@@ -0,0 +1,60 @@
+"""Skills page: interactive skill categories."""
+
+import streamlit as st
+
+from portfolio import content, lite
+from portfolio.metrics import track
+from portfolio.session import touch
+
+
+# Fragments: clicking a skill or moving a slider reruns only that block,
+# not the sidebar, styles and the rest of the page. Those reruns skip the
+# main script, so each fragment records its own metrics and activity.
+
+@st.fragment
+def molecular_skill_buttons(skills):
+    with track("fragment:skill_buttons"):
+        touch()
+        cols = st.columns(4)
+        for i, skill in enumerate(skills):
+            with cols[i % 4]:
+                if st.button(skill, key=f"bio_{i}"):
+                    lite.celebrate()
+                    if skill == "CRISPR-Cas9":
+                        st.success("🧬 Precision genome editing with CRISPR-Cas9!")
+                    elif skill == "qPCR":
+                        st.success("📊 Quantitative PCR for gene expression analysis!")
+                    elif skill == "DNA Sequencing":
+                        st.success("🧬 Next-generation sequencing for genomic insights!")
+                    else:
+                        st.success(f"✨ Expert in {skill} - Driving biotech innovation!")
+
+
+@st.fragment
+def skill_ratings(tech_skills):
+    with track("fragment:skill_ratings"):
+        touch()
+        # Interactive skill rating
+        st.markdown("### 📊 Skill Proficiency Levels")
+        for skill in tech_skills:
+            proficiency = st.slider(f"{skill}", 1, 10, 8, key=f"tech_{skill}")
+            st.write(f"{skill}: {'⭐' * proficiency}")
+
+
+def render():
+    st.markdown('<h2 class="section-header">🚀 Biotech Skills Showcase</h2>', unsafe_allow_html=True)
+    
+    # Skill categories with interactive elements
+    skill_category = st.selectbox(
+        "🎯 Choose a skill category to explore:",
+        content.skill_categories(),
+        format_func=lambda category: category.label
+    )
+    
+    if skill_category.id == "molecular":
+        st.markdown("*Click on any skill to learn more!*")
+        
+        molecular_skill_buttons(content.molecular_skills())
+    
+    elif skill_category.id == "bioinformatics":
+        skill_ratings(content.tech_skills())
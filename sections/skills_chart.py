@@ -0,0 +1,28 @@
+"""Skills Chart page: plotly visualisations of skill proficiency."""
+
+import streamlit as st
+
+from portfolio import lite
+from portfolio.charts import CHART_TYPES, cached_chart_image, chart_payload
+from portfolio.experience import skills_data
+
+
+def render():
+    st.markdown('<h2 class="section-header">📊 Biotech Skills Visualization</h2>', unsafe_allow_html=True)
+    
+    chart_type = st.selectbox("📈 Choose visualization type:", CHART_TYPES)
+    
+    # Data comes from the experience log (re-aggregated only when it grows);
+    # figures are rebuilt only when that data changes
+    data = skills_data()
+    if not lite.enabled():
+        st.plotly_chart(chart_payload(chart_type, data), use_container_width=True)
+        return
+    
+    # Lite mode: the PNG rendered at warm-up instead of plotly.js, or a
+    # plain table while it is still being rendered (or without kaleido)
+    image = cached_chart_image(chart_type, data)
+    if image is not None:
+        st.image(image, use_container_width=True)
+    else:
+        st.table(data)